@@ -7,114 +7,384 @@ Provides two tools for accessing Modus documentation:
 2. get_modus_component_data - Fetches component-specific documentation
 """
 
+import functools
 import json
 import logging
+import mmap
 import os
+import threading
+import time
 from pathlib import Path
-from typing import Any
+from typing import Any, Optional
 
 from fastmcp import FastMCP
 
+try:
+    import orjson
+except ImportError:  # Fall back to the stdlib encoder if orjson isn't installed
+    orjson = None
+
 # Configure logging to stderr (NEVER use print() or stdout in MCP servers)
+# LOG_LEVEL=WARNING silences the per-request INFO lines in production
+_LOG_LEVEL_NAME = os.getenv("LOG_LEVEL", "INFO").upper()
+# getLevelName maps a registered level name to its number, anything else to a string
+_log_level = logging.getLevelName(_LOG_LEVEL_NAME)
 logging.basicConfig(
-    level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+    level=_log_level if isinstance(_log_level, int) else logging.INFO,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
 )
 logger = logging.getLogger("modus-docs-server")
+if not isinstance(_log_level, int):
+    # A typo in LOG_LEVEL shouldn't keep the server from starting
+    logger.warning("Unknown LOG_LEVEL %r, using INFO", _LOG_LEVEL_NAME)
 
 # Base directory for the documentation
 BASE_DIR = Path(__file__).parent.absolute()
 DOCS_DIR = BASE_DIR / "docs"
 COMPONENT_DOCS_DIR = BASE_DIR / "component-docs"
 
+# Tool responses are compact JSON; set MODUS_PRETTY=1 to indent them for debugging
+PRETTY_JSON = bool(os.getenv("MODUS_PRETTY"))
+
+# Success responses have a fixed shape, so only the variable fields are encoded
+if PRETTY_JSON:
+    _IMPLEMENTATION_ENVELOPE = (
+        "{\n"
+        '  "document_name": %s,\n'
+        '  "file_path": %s,\n'
+        '  "content": %s,\n'
+        '  "type": "implementation_guide",\n'
+        '  "format": "mdx"\n'
+        "}"
+    )
+    _COMPONENT_ENVELOPE = (
+        "{\n"
+        '  "component_name": %s,\n'
+        '  "file_path": %s,\n'
+        '  "data": %s,\n'
+        '  "type": "component_documentation",\n'
+        '  "format": "json"\n'
+        "}"
+    )
+else:
+    _IMPLEMENTATION_ENVELOPE = (
+        '{"document_name":%s,"file_path":%s,"content":%s,'
+        '"type":"implementation_guide","format":"mdx"}'
+    )
+    _COMPONENT_ENVELOPE = (
+        '{"component_name":%s,"file_path":%s,"data":%s,'
+        '"type":"component_documentation","format":"json"}'
+    )
+
+# Doc files at least this large are decoded straight from an mmap instead of read()
+MMAP_THRESHOLD = 64 * 1024
+
+# How long a served doc response is reused before its file is re-checked on disk
+DOC_RECHECK_SECONDS = 1.0
+
+# How long the pre-rendered "_all_components" response is served before re-checking the file
+ALL_COMPONENTS_RECHECK_SECONDS = 60.0
+
 # Initialize FastMCP server
 mcp = FastMCP("modus-docs")
 
 
-def read_implementation_doc(docs_name: str) -> dict[str, Any]:
-    """
-    Read implementation documentation from the docs/ folder.
+def _index_paths(directory: Path, pattern: str) -> dict[str, Path]:
+    """Map the stems of non-hidden files matching a glob pattern to their paths."""
+    return {f.stem: f for f in directory.glob(pattern) if not f.name.startswith(".")}
 
-    Args:
-        docs_name: Name of the document (without .mdx extension)
 
-    Returns:
-        Dictionary with document content and metadata
-    """
-    doc_path = DOCS_DIR / f"{docs_name}.mdx"
+def _dir_mtime_ns(directory: Path) -> int:
+    """Return a directory's mtime in nanoseconds, or -1 if it is missing."""
+    try:
+        return directory.stat().st_mtime_ns
+    except OSError:
+        return -1
+
+
+def _dumps(obj: Any) -> str:
+    """Serialize a tool response as JSON, using orjson when available."""
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 if PRETTY_JSON else 0
+        return orjson.dumps(obj, option=option).decode("utf-8")
+    if PRETTY_JSON:
+        return json.dumps(obj, indent=2)
+    return json.dumps(obj, separators=(",", ":"))
+
+
+def _loads(text: str) -> Any:
+    """Parse JSON text, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+def _read_doc_text(doc_path: Path) -> str:
+    """Read a UTF-8 doc file, mapping large files into memory instead of copying them."""
+    with open(doc_path, "rb") as f:
+        if os.fstat(f.fileno()).st_size < MMAP_THRESHOLD:
+            return f.read().decode("utf-8")
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return str(mm, "utf-8")
+
+
+# Available document/component paths by name, rebuilt only when their directory changes
+_DOC_PATHS = _index_paths(DOCS_DIR, "*.mdx")
+_COMP_PATHS = _index_paths(COMPONENT_DOCS_DIR, "*.json")
+_listing_mtimes = {
+    DOCS_DIR: _dir_mtime_ns(DOCS_DIR),
+    COMPONENT_DOCS_DIR: _dir_mtime_ns(COMPONENT_DOCS_DIR),
+}
+
 
-    if not doc_path.exists():
-        available_docs = [f.stem for f in DOCS_DIR.glob("*.mdx")]
-        return {
+# Rendered success responses by name, with the monotonic time they were last validated
+_doc_responses: dict[str, tuple[float, str]] = {}
+_component_responses: dict[str, tuple[float, str]] = {}
+
+
+def _pooled_response(
+    pool: dict[str, tuple[float, str]], name: str, now: float
+) -> Optional[str]:
+    """Return a pooled response if it was validated within DOC_RECHECK_SECONDS."""
+    entry = pool.get(name)
+    if entry is not None and now - entry[0] < DOC_RECHECK_SECONDS:
+        return entry[1]
+    return None
+
+
+def _refresh_if_stale(directory: Path) -> None:
+    """Rebuild a directory's doc path table if the directory has been modified."""
+    global _DOC_PATHS, _COMP_PATHS
+
+    mtime_ns = _dir_mtime_ns(directory)
+    if mtime_ns == _listing_mtimes[directory]:
+        return
+
+    if directory == DOCS_DIR:
+        _DOC_PATHS = _index_paths(DOCS_DIR, "*.mdx")
+    else:
+        _COMP_PATHS = _index_paths(COMPONENT_DOCS_DIR, "*.json")
+    _listing_mtimes[directory] = mtime_ns
+
+
+def _document_not_found(docs_name: str) -> str:
+    """Build the error response for an unknown implementation document."""
+    return _dumps(
+        {
             "error": f"Document '{docs_name}' not found",
-            "available_documents": available_docs,
+            "available_documents": sorted(_DOC_PATHS),
             "requested": docs_name,
         }
+    )
 
-    try:
-        content = doc_path.read_text(encoding="utf-8")
-        return {
-            "document_name": docs_name,
-            "file_path": str(doc_path),
-            "content": content,
-            "type": "implementation_guide",
-            "format": "mdx",
-        }
-    except Exception as e:
-        return {
-            "error": f"Error reading document: {str(e)}",
-            "document_name": docs_name,
+
+def _component_not_found(component_name: str) -> str:
+    """Build the error response for an unknown component."""
+    return _dumps(
+        {
+            "error": f"Component '{component_name}' not found",
+            "available_components": sorted(_COMP_PATHS),
+            "requested": component_name,
         }
+    )
+
+
+def read_implementation_doc(docs_name: str) -> str:
+    """
+    Read implementation documentation from the docs/ folder.
 
+    Successful reads are memoized per (path, mtime) so repeated requests for the
+    same document are served from memory until the file changes on disk. A
+    response validated within DOC_RECHECK_SECONDS is reused without any syscalls.
 
-def read_component_doc(component_name: str) -> dict[str, Any]:
+    Args:
+        docs_name: Name of the document (without .mdx extension)
+
+    Returns:
+        JSON string with document content and metadata
+    """
+    now = time.monotonic()
+    response = _pooled_response(_doc_responses, docs_name, now)
+    if response is not None:
+        return response
+
+    _refresh_if_stale(DOCS_DIR)
+    doc_path = _DOC_PATHS.get(docs_name)
+    if doc_path is None:
+        return _document_not_found(docs_name)
+
+    # The stat doubles as the existence check; a file deleted since the table
+    # was built surfaces here as FileNotFoundError
+    try:
+        mtime_ns = doc_path.stat().st_mtime_ns
+        response = _render_implementation_doc(docs_name, doc_path, mtime_ns)
+    except FileNotFoundError:
+        return _document_not_found(docs_name)
+    except Exception as e:
+        return _dumps(
+            {
+                "error": f"Error reading document: {str(e)}",
+                "document_name": docs_name,
+            }
+        )
+
+    _doc_responses[docs_name] = (now, response)
+    return response
+
+
+@functools.lru_cache(maxsize=256)
+def _render_implementation_doc(docs_name: str, doc_path: Path, mtime_ns: int) -> str:
+    """Read and serialize an implementation doc; mtime_ns keys the cache entry."""
+    content = _read_doc_text(doc_path)
+    if "\r" in content:
+        # Keep read_text()'s universal-newline translation
+        content = content.replace("\r\n", "\n").replace("\r", "\n")
+    return _IMPLEMENTATION_ENVELOPE % (
+        _dumps(docs_name),
+        _dumps(str(doc_path)),
+        _dumps(content),
+    )
+
+
+def read_component_doc(component_name: str) -> str:
     """
     Read component documentation from the component-docs/ folder.
 
+    Successful reads are memoized per (path, mtime) so repeated requests for the
+    same component are served from memory until the file changes on disk. A
+    response validated within DOC_RECHECK_SECONDS is reused without any syscalls.
+
     Args:
         component_name: Name of the component (e.g., 'modus-wc-table')
 
     Returns:
-        Dictionary with component documentation
+        JSON string with component documentation
     """
-    # Handle special case for all components catalog
-    if component_name == "_all_components":
-        doc_path = COMPONENT_DOCS_DIR / "_all_components.json"
-    else:
-        doc_path = COMPONENT_DOCS_DIR / f"{component_name}.json"
-
-    if not doc_path.exists():
-        available_components = [
-            f.stem
-            for f in COMPONENT_DOCS_DIR.glob("*.json")
-            if not f.name.startswith(".")
-        ]
-        return {
-            "error": f"Component '{component_name}' not found",
-            "available_components": available_components,
-            "requested": component_name,
-        }
-
+    now = time.monotonic()
+    response = _pooled_response(_component_responses, component_name, now)
+    if response is not None:
+        return response
+
+    _refresh_if_stale(COMPONENT_DOCS_DIR)
+    # The "_all_components" catalog is indexed alongside the component files
+    doc_path = _COMP_PATHS.get(component_name)
+    if doc_path is None:
+        return _component_not_found(component_name)
+
+    # The stat doubles as the existence check; a file deleted since the table
+    # was built surfaces here as FileNotFoundError
     try:
-        with open(doc_path, "r", encoding="utf-8") as f:
-            content = json.load(f)
-
-        return {
-            "component_name": component_name,
-            "file_path": str(doc_path),
-            "data": content,
-            "type": "component_documentation",
-            "format": "json",
-        }
-    except json.JSONDecodeError as e:
-        return {
-            "error": f"Invalid JSON in component documentation: {str(e)}",
-            "component_name": component_name,
-        }
+        mtime_ns = doc_path.stat().st_mtime_ns
+        response = _render_component_doc(component_name, doc_path, mtime_ns)
+    except FileNotFoundError:
+        return _component_not_found(component_name)
+    except json.JSONDecodeError as e:  # Also catches orjson.JSONDecodeError
+        return _dumps(
+            {
+                "error": f"Invalid JSON in component documentation: {str(e)}",
+                "component_name": component_name,
+            }
+        )
     except Exception as e:
-        return {
-            "error": f"Error reading component documentation: {str(e)}",
-            "component_name": component_name,
-        }
+        return _dumps(
+            {
+                "error": f"Error reading component documentation: {str(e)}",
+                "component_name": component_name,
+            }
+        )
+
+    _component_responses[component_name] = (now, response)
+    return response
+
+
+@functools.lru_cache(maxsize=256)
+def _render_component_doc(component_name: str, doc_path: Path, mtime_ns: int) -> str:
+    """
+    Read a component doc and splice its JSON into the response envelope.
+
+    The file is parsed once when the entry is cached. In compact mode it is
+    re-encoded without whitespace at that point; with MODUS_PRETTY the file's
+    own formatting is spliced in as-is.
+    """
+    raw = _read_doc_text(doc_path)
+    data = _loads(raw)
+    if not PRETTY_JSON:
+        raw = _dumps(data)
+
+    return _COMPONENT_ENVELOPE % (
+        _dumps(component_name),
+        _dumps(str(doc_path)),
+        raw.strip(),
+    )
+
+
+# Pre-rendered "_all_components" catalog response and when it was last validated
+_all_components_response: Optional[str] = None
+_all_components_checked_at = 0.0
+
+
+def _all_components_catalog() -> str:
+    """
+    Return the "_all_components" catalog response.
+
+    Every LLM session tends to start with this call, so the rendered response is
+    kept in a module global and only re-checked against the file's mtime once
+    per ALL_COMPONENTS_RECHECK_SECONDS.
+    """
+    global _all_components_response, _all_components_checked_at
+
+    now = time.monotonic()
+    if (
+        _all_components_response is not None
+        and now - _all_components_checked_at < ALL_COMPONENTS_RECHECK_SECONDS
+    ):
+        return _all_components_response
+
+    doc_path = COMPONENT_DOCS_DIR / "_all_components.json"
+    try:
+        mtime_ns = doc_path.stat().st_mtime_ns
+        response = _render_component_doc("_all_components", doc_path, mtime_ns)
+    except Exception:
+        # Let the regular reader build the error response; errors are never pinned
+        _all_components_response = None
+        return read_component_doc("_all_components")
+
+    _all_components_response = response
+    _all_components_checked_at = now
+    return response
+
+
+def _prefetch_docs() -> None:
+    """Ask the kernel to pull every doc file into the page cache ahead of reads."""
+    if not hasattr(os, "posix_fadvise"):
+        return
+
+    for doc_path in [*DOCS_DIR.glob("*.mdx"), *COMPONENT_DOCS_DIR.glob("*.json")]:
+        try:
+            fd = os.open(doc_path, os.O_RDONLY)
+        except OSError:
+            continue
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+
+
+def _warm_cache() -> None:
+    """Read every doc once so requests are served from the cache from startup."""
+    _prefetch_docs()
+    for docs_name in sorted(_DOC_PATHS):
+        read_implementation_doc(docs_name)
+    for component_name in sorted(_COMP_PATHS):
+        read_component_doc(component_name)
+    _all_components_catalog()
+    logger.info(
+        "Warmed doc cache: %d documents, %d components",
+        len(_DOC_PATHS),
+        len(_COMP_PATHS),
+    )
 
 
 @mcp.tool()
@@ -136,9 +406,8 @@ def get_modus_implementation_data(docs_name: str) -> str:
     Returns:
         JSON string containing the document content and metadata
     """
-    logger.info(f"Fetching implementation doc: {docs_name}")
-    result = read_implementation_doc(docs_name)
-    return json.dumps(result, indent=2)
+    logger.info("Fetching implementation doc: %s", docs_name)
+    return read_implementation_doc(docs_name)
 
 
 @mcp.tool()
@@ -162,9 +431,10 @@ def get_modus_component_data(component_name: str) -> str:
     Returns:
         JSON string containing the component's complete documentation
     """
-    logger.info(f"Fetching component doc: {component_name}")
-    result = read_component_doc(component_name)
-    return json.dumps(result, indent=2)
+    logger.info("Fetching component doc: %s", component_name)
+    if component_name == "_all_components":
+        return _all_components_catalog()
+    return read_component_doc(component_name)
 
 
 if __name__ == "__main__":
@@ -172,5 +442,7 @@ if __name__ == "__main__":
     # Use environment variables for configuration (useful for Docker)
     host = os.getenv("HOST", "0.0.0.0")
     port = int(os.getenv("PORT", "8080"))
-    logger.info(f"Starting MCP server on {host}:{port}")
+    logger.info("Starting MCP server on %s:%s", host, port)
+    # Warm the doc cache in the background so startup isn't delayed
+    threading.Thread(target=_warm_cache, name="warm-doc-cache", daemon=True).start()
     mcp.run(transport="http", host=host, port=port)
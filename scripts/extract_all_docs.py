@@ -15,26 +15,140 @@ The extracted documentation is organized into a consolidated structure with:
 import os
 import sys
 import json
+import errno
 import shutil
+import glob
 from typing import Dict, Any, List
 from pathlib import Path
 import re
+import logging
+import argparse
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 
 # Add src directory to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
+logger = logging.getLogger("extract-all-docs")
+
 # Configuration
 MODUS_LOCAL_DIR = "./data/modus-wc-2.0"
 DOCS_OUTPUT_DIR = "./docs"
+COPY_WORKERS = 16  # Copies are I/O-bound, so run several at once
+
+# File suffixes matched while scanning the Modus source tree
+_MDX_SUFFIX = '.mdx'
+_ICON_SUFFIX = '.icon.tsx'
+_ICON_SUFFIX_LEN = len(_ICON_SUFFIX)
+_EXAMPLE_SUFFIXES = ('.tsx', '.vue', '.ts', '.js')
+_COMPONENT_PREFIX = 'modus-wc-'
+
+# Icon name keywords and their categories, checked in order; first match wins
+_ICON_CATEGORIES = {
+    'outline': 'outline',
+    'solid': 'solid',
+    'dark': 'theme',
+    'light': 'theme',
+    'logo': 'branding',
+}
+
+# Files written during this run, keyed by directory relative to DOCS_OUTPUT_DIR
+_extracted: Dict[str, set] = {}
 
 def ensure_output_dir():
     """Ensure the output directory structure exists"""
     os.makedirs(DOCS_OUTPUT_DIR, exist_ok=True)
     os.makedirs("./component-docs", exist_ok=True)
 
+# errno values meaning a copy syscall can't handle this pair of files
+_COPY_FALLBACK_ERRNOS = {errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP}
+
+def _copy_file_range(in_fd, out_fd, size):
+    """Copy size bytes with os.copy_file_range; returns False if unavailable or short"""
+    if not hasattr(os, 'copy_file_range'):
+        return False
+    offset = 0
+    while offset < size:
+        copied = os.copy_file_range(in_fd, out_fd, size - offset, offset, offset)
+        if copied == 0:
+            # The source ended early (it shrank, or the filesystem reports
+            # sizes it can't deliver); let the caller fall back
+            return False
+        offset += copied
+    return True
+
+def _sendfile(in_fd, out_fd, size):
+    """Copy size bytes with os.sendfile; returns False if unavailable or short"""
+    if not hasattr(os, 'sendfile'):
+        return False
+    offset = 0
+    while offset < size:
+        sent = os.sendfile(out_fd, in_fd, offset, size - offset)
+        if sent == 0:
+            # The source ended early; let the caller fall back
+            return False
+        offset += sent
+    return True
+
+def _fast_copy(source_path, output_path):
+    """
+    Copy a file's contents without moving them through user space.
+
+    Tries os.copy_file_range, then os.sendfile, and falls back to
+    shutil.copyfile when neither syscall can handle the files or copy
+    all of the source's reported size.
+    File metadata (mtime, permissions) is not copied.
+    """
+    with open(source_path, 'rb') as src, open(output_path, 'wb') as dst:
+        in_fd, out_fd = src.fileno(), dst.fileno()
+        size = os.fstat(in_fd).st_size
+        # An empty size may just be unknown (procfs-like files), so only
+        # shutil.copyfile, which reads to EOF, handles it
+        for kernel_copy in (_copy_file_range, _sendfile) if size else ():
+            try:
+                if kernel_copy(in_fd, out_fd, size):
+                    return
+            except OSError as e:
+                if e.errno not in _COPY_FALLBACK_ERRNOS:
+                    raise
+    
+    shutil.copyfile(source_path, output_path)
+
+def _copy_file(paths):
+    """Copy a single (source, output) pair, returning the exception if it fails"""
+    source_path, output_path = paths
+    try:
+        _fast_copy(source_path, output_path)
+        return None
+    except Exception as e:
+        return e
+
+def _record_extracted(output_path):
+    """Remember an output file so the documentation index needn't re-walk the tree"""
+    rel_path = os.path.relpath(os.path.dirname(output_path), DOCS_OUTPUT_DIR)
+    if rel_path == ".":
+        rel_path = "root"
+    _extracted.setdefault(rel_path, set()).add(os.path.basename(output_path))
+
+def copy_files(pairs):
+    """
+    Copy (source, output) path pairs in parallel.
+
+    Returns:
+        A list with one entry per pair: None on success, or the exception raised
+    """
+    if not pairs:
+        return []
+    with ThreadPoolExecutor(max_workers=COPY_WORKERS) as executor:
+        errors = list(executor.map(_copy_file, pairs))
+    for (_, output_path), error in zip(pairs, errors):
+        if error is None:
+            _record_extracted(output_path)
+    return errors
+
 def extract_framework_docs():
     """Extract framework .mdx files only"""
-    print("📚 Extracting framework .mdx files...")
+    logger.info("📚 Extracting framework .mdx files...")
     
     framework_files = [
         ("src/stories/frameworks/react.mdx", "react.mdx"),
@@ -43,26 +157,30 @@ def extract_framework_docs():
     ]
     
     extracted_count = 0
+    copy_jobs = []
     
     for source_path, output_filename in framework_files:
         full_source_path = os.path.join(MODUS_LOCAL_DIR, source_path)
         output_path = os.path.join(DOCS_OUTPUT_DIR, output_filename)
         
         if os.path.exists(full_source_path):
-            try:
-                shutil.copy2(full_source_path, output_path)
-                print(f"  ✅ {source_path} -> {output_filename}")
-                extracted_count += 1
-            except Exception as e:
-                print(f"  ❌ Failed to copy {source_path}: {e}")
+            copy_jobs.append((source_path, output_filename, full_source_path, output_path))
+        else:
+            logger.warning("  ⚠️  Not found: %s", source_path)
+    
+    errors = copy_files([(src, dst) for _, _, src, dst in copy_jobs])
+    for (source_path, output_filename, _, _), error in zip(copy_jobs, errors):
+        if error is None:
+            logger.info("  ✅ %s -> %s", source_path, output_filename)
+            extracted_count += 1
         else:
-            print(f"  ⚠️  Not found: {source_path}")
+            logger.error("  ❌ Failed to copy %s: %s", source_path, error)
     
-    print(f"  📊 Extracted {extracted_count} framework .mdx files")
+    logger.info("  📊 Extracted %d framework .mdx files", extracted_count)
 
 def extract_general_docs():
     """Extract general documentation files"""
-    print("📄 Extracting general documentation...")
+    logger.info("📄 Extracting general documentation...")
     
     general_docs = [
         ("README.md", "main-README.md"),
@@ -78,61 +196,72 @@ def extract_general_docs():
         ("docs/responsive-design.md", "responsive-design.md")
     ]
     
+    general_output = os.path.join(DOCS_OUTPUT_DIR, "general")
     extracted_count = 0
+    copy_jobs = []
     
     for source_file, output_file in general_docs:
         source_path = os.path.join(MODUS_LOCAL_DIR, source_file)
-        output_path = os.path.join(DOCS_OUTPUT_DIR, "general", output_file)
+        output_path = os.path.join(general_output, output_file)
         
         if os.path.exists(source_path):
-            try:
-                shutil.copy2(source_path, output_path)
-                print(f"  ✅ {source_file} -> {output_file}")
-                extracted_count += 1
-            except Exception as e:
-                print(f"  ❌ Failed to copy {source_file}: {e}")
+            copy_jobs.append((source_file, output_file, source_path, output_path))
+        else:
+            logger.warning("  ⚠️  Not found: %s", source_file)
+    
+    errors = copy_files([(src, dst) for _, _, src, dst in copy_jobs])
+    for (source_file, output_file, _, _), error in zip(copy_jobs, errors):
+        if error is None:
+            logger.info("  ✅ %s -> %s", source_file, output_file)
+            extracted_count += 1
         else:
-            print(f"  ⚠️  Not found: {source_file}")
+            logger.error("  ❌ Failed to copy %s: %s", source_file, error)
     
-    print(f"  📊 Extracted {extracted_count} general documentation files")
+    logger.info("  📊 Extracted %d general documentation files", extracted_count)
 
 def extract_storybook_docs():
     """Extract Storybook documentation files"""
-    print("📖 Extracting Storybook documentation...")
+    logger.info("📖 Extracting Storybook documentation...")
     
     stories_dir = os.path.join(MODUS_LOCAL_DIR, "src/stories")
     getting_started_output = DOCS_OUTPUT_DIR
     
     extracted_count = 0
+    copy_jobs = []
     
     if os.path.exists(stories_dir):
-        for file in os.listdir(stories_dir):
-            if file.endswith('.mdx'):
-                source_path = os.path.join(stories_dir, file)
-                output_path = os.path.join(getting_started_output, file)
-                
-                try:
-                    shutil.copy2(source_path, output_path)
-                    print(f"  ✅ stories/{file}")
-                    extracted_count += 1
-                except Exception as e:
-                    print(f"  ❌ Failed to copy stories/{file}: {e}")
-    
-    print(f"  📊 Extracted {extracted_count} Storybook documentation files")
+        with os.scandir(stories_dir) as entries:
+            for entry in entries:
+                if entry.name.endswith(_MDX_SUFFIX) and entry.is_file():
+                    output_path = os.path.join(getting_started_output, entry.name)
+                    copy_jobs.append((entry.name, entry.path, output_path))
+    
+    errors = copy_files([(src, dst) for _, src, dst in copy_jobs])
+    for (file, _, _), error in zip(copy_jobs, errors):
+        if error is None:
+            logger.info("  ✅ stories/%s", file)
+            extracted_count += 1
+        else:
+            logger.error("  ❌ Failed to copy stories/%s: %s", file, error)
+    
+    logger.info("  📊 Extracted %d Storybook documentation files", extracted_count)
 
 def extract_icons_info():
     """Extract icons information and create icons documentation"""
-    print("🎨 Extracting icons documentation...")
+    logger.info("🎨 Extracting icons documentation...")
     
     icons_dir = os.path.join(MODUS_LOCAL_DIR, "src/icons")
     icons_output = os.path.join(DOCS_OUTPUT_DIR, "icons")
     
     if not os.path.exists(icons_dir):
-        print("  ❌ Icons directory not found")
+        logger.error("  ❌ Icons directory not found")
         return
     
-    # Get all icon files
-    icon_files = [f for f in os.listdir(icons_dir) if f.endswith('.icon.tsx')]
+    # Get all icon files, letting glob do the suffix filtering
+    icon_files = [
+        os.path.basename(path)
+        for path in glob.iglob(os.path.join(glob.escape(icons_dir), '*' + _ICON_SUFFIX))
+    ]
     
     # Create icons documentation
     icons_data = {
@@ -140,20 +269,16 @@ def extract_icons_info():
         "icons": [],
         "categories": {}
     }
+    categories = defaultdict(list)
     
     for icon_file in icon_files:
-        icon_name = icon_file.replace('.icon.tsx', '')
+        icon_name = icon_file[:-_ICON_SUFFIX_LEN]
         
         # Try to categorize icons
-        category = "general"
-        if "outline" in icon_name:
-            category = "outline"
-        elif "solid" in icon_name:
-            category = "solid"
-        elif "dark" in icon_name or "light" in icon_name:
-            category = "theme"
-        elif "logo" in icon_name:
-            category = "branding"
+        category = next(
+            (category for keyword, category in _ICON_CATEGORIES.items() if keyword in icon_name),
+            "general"
+        )
         
         icon_info = {
             "name": icon_name,
@@ -162,60 +287,63 @@ def extract_icons_info():
         }
         
         icons_data["icons"].append(icon_info)
-        
-        if category not in icons_data["categories"]:
-            icons_data["categories"][category] = []
-        icons_data["categories"][category].append(icon_name)
+        categories[category].append(icon_name)
+    
+    icons_data["categories"] = dict(categories)
     
     # Save icons documentation
     icons_doc_path = os.path.join(icons_output, "icons-catalog.json")
     with open(icons_doc_path, 'w') as f:
         json.dump(icons_data, f, indent=2)
+    _record_extracted(icons_doc_path)
     
     # Copy the modus-icon-usage.mdx if it exists
     icon_usage_source = os.path.join(MODUS_LOCAL_DIR, "src/stories/modus-icon-usage.mdx")
     if os.path.exists(icon_usage_source):
         icon_usage_output = os.path.join(icons_output, "modus-icon-usage.mdx")
-        shutil.copy2(icon_usage_source, icon_usage_output)
-        print(f"  ✅ Copied icon usage documentation")
+        _fast_copy(icon_usage_source, icon_usage_output)
+        _record_extracted(icon_usage_output)
+        logger.info("  ✅ Copied icon usage documentation")
     
-    print(f"  📊 Cataloged {len(icon_files)} icons across {len(icons_data['categories'])} categories")
+    logger.info("  📊 Cataloged %d icons across %d categories", len(icon_files), len(icons_data['categories']))
 
 def extract_component_readmes():
     """Extract individual component README files"""
-    print("📦 Extracting component README files...")
+    logger.info("📦 Extracting component README files...")
     
     components_dir = os.path.join(MODUS_LOCAL_DIR, "src/components")
     components_output = os.path.join(DOCS_OUTPUT_DIR, "components")
     
     if not os.path.exists(components_dir):
-        print("  ❌ Components directory not found")
+        logger.error("  ❌ Components directory not found")
         return
     
     extracted_count = 0
+    copy_jobs = []
     
-    for item in os.listdir(components_dir):
-        component_path = os.path.join(components_dir, item)
-        
-        if os.path.isdir(component_path) and item.startswith('modus-wc-'):
-            readme_path = os.path.join(component_path, "readme.md")
-            
-            if os.path.exists(readme_path):
-                output_filename = f"{item}-README.md"
-                output_path = os.path.join(components_output, output_filename)
+    with os.scandir(components_dir) as entries:
+        for entry in entries:
+            if entry.name.startswith(_COMPONENT_PREFIX) and entry.is_dir():
+                readme_path = os.path.join(entry.path, "readme.md")
                 
-                try:
-                    shutil.copy2(readme_path, output_path)
-                    print(f"  ✅ {item}/readme.md -> {output_filename}")
-                    extracted_count += 1
-                except Exception as e:
-                    print(f"  ❌ Failed to copy {item}/readme.md: {e}")
-    
-    print(f"  📊 Extracted {extracted_count} component README files")
+                if os.path.exists(readme_path):
+                    output_filename = f"{entry.name}-README.md"
+                    output_path = os.path.join(components_output, output_filename)
+                    copy_jobs.append((entry.name, output_filename, readme_path, output_path))
+    
+    errors = copy_files([(src, dst) for _, _, src, dst in copy_jobs])
+    for (item, output_filename, _, _), error in zip(copy_jobs, errors):
+        if error is None:
+            logger.info("  ✅ %s/readme.md -> %s", item, output_filename)
+            extracted_count += 1
+        else:
+            logger.error("  ❌ Failed to copy %s/readme.md: %s", item, error)
+    
+    logger.info("  📊 Extracted %d component README files", extracted_count)
 
 def extract_examples():
     """Extract framework integration examples"""
-    print("💡 Extracting framework examples...")
+    logger.info("💡 Extracting framework examples...")
     
     examples_output = os.path.join(DOCS_OUTPUT_DIR, "examples")
     
@@ -234,24 +362,44 @@ def extract_examples():
             os.makedirs(framework_output, exist_ok=True)
             
             try:
-                for file in os.listdir(full_source_path):
-                    if file.endswith(('.tsx', '.vue', '.ts', '.js')):
-                        source_file = os.path.join(full_source_path, file)
-                        output_file = os.path.join(framework_output, file)
-                        shutil.copy2(source_file, output_file)
-                        extracted_count += 1
+                copy_pairs = []
+                with os.scandir(full_source_path) as entries:
+                    for entry in entries:
+                        if entry.name.endswith(_EXAMPLE_SUFFIXES) and entry.is_file():
+                            output_file = os.path.join(framework_output, entry.name)
+                            copy_pairs.append((entry.path, output_file))
                 
-                print(f"  ✅ Extracted {framework} examples")
+                errors = [error for error in copy_files(copy_pairs) if error is not None]
+                extracted_count += len(copy_pairs) - len(errors)
+                if errors:
+                    raise errors[0]
+                
+                logger.info("  ✅ Extracted %s examples", framework)
             except Exception as e:
-                print(f"  ❌ Failed to extract {framework} examples: {e}")
+                logger.error("  ❌ Failed to extract %s examples: %s", framework, e)
         else:
-            print(f"  ⚠️  Examples not found: {source_path}")
+            logger.warning("  ⚠️  Examples not found: %s", source_path)
     
-    print(f"  📊 Extracted {extracted_count} example files")
+    logger.info("  📊 Extracted %d example files", extracted_count)
+
+def _scan_output_dir(path, rel_path, structure):
+    """Recursively collect file names per directory, skipping hidden directories"""
+    files = []
+    with os.scandir(path) as entries:
+        for entry in entries:
+            # Like os.walk, symlinked directories are neither files nor descended into
+            if entry.is_dir():
+                if not entry.is_symlink() and not entry.name.startswith('.'):
+                    child_rel_path = entry.name if rel_path == "root" else os.path.join(rel_path, entry.name)
+                    _scan_output_dir(entry.path, child_rel_path, structure)
+            else:
+                files.append(entry.name)
+    if files:  # Only include directories with files
+        structure[rel_path] = sorted(files)
 
 def create_documentation_index():
     """Create an index of all extracted documentation"""
-    print("📋 Creating documentation index...")
+    logger.info("📋 Creating documentation index...")
     
     index = {
         "extraction_info": {
@@ -263,35 +411,36 @@ def create_documentation_index():
         "file_count": 0
     }
     
-    # Walk through the output directory and catalog everything
-    for root, dirs, files in os.walk(DOCS_OUTPUT_DIR):
-        if files:  # Only include directories with files
-            rel_path = os.path.relpath(root, DOCS_OUTPUT_DIR)
-            if rel_path == ".":
-                rel_path = "root"
-            
-            index["structure"][rel_path] = {
-                "files": files,
-                "count": len(files)
-            }
-            index["file_count"] += len(files)
+    # Catalog the files extracted during this run; only scan the output
+    # directory when nothing was extracted (e.g. the index is built standalone)
+    structure = {rel_path: sorted(files) for rel_path, files in _extracted.items()}
+    if not structure:
+        _scan_output_dir(DOCS_OUTPUT_DIR, "root", structure)
+    
+    for rel_path in sorted(structure):
+        files = structure[rel_path]
+        index["structure"][rel_path] = {
+            "files": files,
+            "count": len(files)
+        }
+        index["file_count"] += len(files)
     
     # Save index
     index_path = os.path.join(DOCS_OUTPUT_DIR, "_documentation_index.json")
     with open(index_path, 'w') as f:
         json.dump(index, f, indent=2)
     
-    print(f"  📊 Created index with {index['file_count']} total files")
+    logger.info("  📊 Created index with %d total files", index['file_count'])
 
 def main():
     """Main execution function"""
-    print("🚀 Modus Documentation Extraction Tool (Consolidated with Frameworks)")
-    print("=" * 60)
+    logger.info("🚀 Modus Documentation Extraction Tool (Consolidated with Frameworks)")
+    logger.info("=" * 60)
     
     # Check if Modus source exists
     if not os.path.exists(MODUS_LOCAL_DIR):
-        print(f"❌ Modus source not found at {MODUS_LOCAL_DIR}")
-        print("💡 Please run update_modus_components.py first to get the source code")
+        logger.error("❌ Modus source not found at %s", MODUS_LOCAL_DIR)
+        logger.error("💡 Please run update_modus_components.py first to get the source code")
         return
     
     try:
@@ -304,16 +453,20 @@ def main():
         # Step 3: Extract Storybook documentation (getting-started)
         extract_storybook_docs()
         
-        print("\n✅ Documentation extraction complete!")
-        print(f"📁 All documentation available at: {DOCS_OUTPUT_DIR}")
-        print("📋 Structure:")
-        print("   docs/                    - Framework .mdx files and getting-started guides")
-        print("   component-docs/          - Component specifications")
+        logger.info("\n✅ Documentation extraction complete!")
+        logger.info("📁 All documentation available at: %s", DOCS_OUTPUT_DIR)
+        logger.info("📋 Structure:")
+        logger.info("   docs/                    - Framework .mdx files and getting-started guides")
+        logger.info("   component-docs/          - Component specifications")
         
     except Exception as e:
-        print(f"\n❌ Error: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("\n❌ Error: %s", e)
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Extract consolidated Modus documentation")
+    parser.add_argument("-v", "--verbose", action="store_true",
+                        help="Log per-file progress (only warnings and errors are shown by default)")
+    args = parser.parse_args()
+    
+    logging.basicConfig(level=logging.INFO if args.verbose else logging.WARNING, format="%(message)s")
     main()
@@ -9,7 +9,115 @@ properties, events, methods, slots, story examples, and usage scripts with their
 import os
 import re
 import json
-from typing import Dict, Any, List, Optional
+import hashlib
+import functools
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from typing import Dict, Any, Iterator, List, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:  # Fall back to the stdlib encoder if orjson isn't installed
+    orjson = None  # type: ignore[assignment]
+
+# Patterns are compiled once at import time; none of them depend on runtime values.
+# Multi-line declarations are matched with \s and character classes (or flattened
+# first), so none need re.DOTALL
+_PROP_RE = re.compile(r'@Prop\([^)]*\)\s*(\w+[?!]?)\s*(?::\s*([^=;]+?))?\s*=\s*([^;]+?);')
+_PROP_RE_NODEFAULT = re.compile(r'@Prop\([^)]*\)\s*(\w+[?!]?)\s*:\s*([^=;]+?);')
+_MUTABLE_RE = re.compile(r'mutable:\s+true')
+# Numeric literal default such as 5, -1.5 or .25
+_NUMLIT_RE = re.compile(r'-?(?:\d+(?:\.\d*)?|\.\d+)')
+_EVENT_RE = re.compile(r'@(?:Event|StencilEvent)\(\)\s*(\w+)!?')
+_EMITTER_RE = re.compile(r'EventEmitter<(.+?)>')
+_METHOD_RE = re.compile(r'(?:async\s+)?(\w+)\s*\(([^)]*)\)(?:\s*:\s*([^{]+?))?(?:\s*{)?')
+_SLOT_RE = re.compile(r'<slot\s*(?:name="([^"]*)")?')
+_ARGS_RE = re.compile(r'args:\s*{')
+_ARG_RE = re.compile(r"'?(\w+)'?\s*:\s*([^,]+)(?:,|$)")
+_ARGTYPES_RE = re.compile(r'argTypes:\s*{')
+_ARGTYPE_ENTRY_RE = re.compile(r"(\w+):\s*{")
+_CONTROL_RE = re.compile(r'control:\s*{\s*type:\s*[\'"](\w+)[\'"]')
+_OPTIONS_RE = re.compile(r'options:\s*\[([^\]]+)\]')
+_TEMPLATE_RE = re.compile(r'return html`([^`]+)`')
+_HANDLES_RE = re.compile(r'handles:\s*\[([^\]]+)\]')
+# A line whose stripped text ends with "};" or ">;", closing an event declaration
+_EVENT_END_RE = re.compile(r'[}>];[^\S\n]*$', re.MULTILINE)
+# Line that ends a render block
+_RENDER_END_RE = re.compile(r'^[^\n]*(?:</Host>|return[^\n]*\}|\}[^\n]*return)', re.MULTILINE)
+_NONBLANK_RE = re.compile(r'\S')
+# How far past a decorator the extractors look for the end of its declaration
+_SCAN_WINDOW = 4096
+# One JSDoc line: optional leading "/**" or "*" run, the text, optional closing "*/"
+_JSDOC_LINE_RE = re.compile(r'^\s*(?:/\*+|\*+(?!/))?\s*(.*?)\s*(?:\*+/)?\s*$')
+# Openers of nested literals in story args, mapped to their closers
+_BRACKET_PAIRS = {'{': '}', '[': ']'}
+# Project root (go up from scripts/src/ to project root)
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Large write buffer so a whole doc is flushed in a few syscalls
+_WRITE_BUFFER_SIZE = 1 << 20
+# Decorators that start a line, e.g. "  @Prop() name: string;"
+_DECORATOR_RE = re.compile(r'^[^\S\n]*@(Prop|Event|StencilEvent|Method)', re.MULTILINE)
+
+
+# Slotted records are smaller and faster to read
+@dataclass(slots=True)
+class PropInfo:
+    """A parsed @Prop declaration"""
+    name: str
+    type: str
+    description: str
+    default: Optional[str]
+    mutable: bool
+    end_line: int
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "type": self.type,
+            "description": self.description,
+            "default": self.default,
+            "mutable": self.mutable,
+            "end_line": self.end_line
+        }
+
+
+@dataclass(slots=True)
+class EventInfo:
+    """A parsed @Event or @StencilEvent declaration"""
+    name: str
+    detail: str
+    description: str
+    end_line: int
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "detail": self.detail,
+            "description": self.description,
+            "end_line": self.end_line
+        }
+
+
+@dataclass(slots=True)
+class MethodInfo:
+    """A parsed @Method declaration"""
+    name: str
+    signature: str
+    parameters: str
+    return_type: str
+    description: str
+    end_line: int
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "signature": self.signature,
+            "parameters": self.parameters,
+            "returnType": self.return_type,
+            "description": self.description,
+            "end_line": self.end_line
+        }
+
 
 def parse_stencil_component(file_content: str) -> Dict[str, Any]:
     """
@@ -22,7 +130,7 @@ def parse_stencil_component(file_content: str) -> Dict[str, Any]:
         Dictionary containing component description, properties, events, methods, slots,
         story examples, and usage scripts
     """
-    doc = {
+    doc: Dict[str, Any] = {
         "description": "", 
         "properties": [], 
         "events": [], 
@@ -32,270 +140,300 @@ def parse_stencil_component(file_content: str) -> Dict[str, Any]:
         "scripts": []
     }
     
-    lines = file_content.split('\n')
+    # Index every JSDoc block once; descriptions are looked up by line offset
+    jsdoc_index = _index_jsdoc(file_content)
     
     # Extract component description from JSDoc before @Component (if it exists)
-    component_description = extract_component_description(lines)
+    component_description = extract_component_description(file_content, jsdoc_index)
     doc["description"] = component_description
     
-    # Parse properties, events, and methods
-    i = 0
-    while i < len(lines):
-        line = lines[i].strip()
-        
-        # Handle @Prop decorators
-        if line.startswith('@Prop'):
-            prop_info = extract_prop_info(lines, i)
-            if prop_info:
-                doc["properties"].append(prop_info)
-                i = prop_info.get('end_line', i) + 1
-                continue
-        
-        # Handle @Event and @StencilEvent decorators
-        elif line.startswith('@Event') or line.startswith('@StencilEvent'):
-            event_info = extract_event_info(lines, i)
-            if event_info:
-                doc["events"].append(event_info)
-                i = event_info.get('end_line', i) + 1
-                continue
-        
-        # Handle @Method decorators
-        elif line.startswith('@Method'):
-            method_info = extract_method_info(lines, i)
-            if method_info:
-                doc["methods"].append(method_info)
-                i = method_info.get('end_line', i) + 1
-                continue
+    # Parse properties, events, and methods in a single pass over the decorators;
+    # line numbers are counted incrementally between matches
+    line_no: int = 0
+    last_pos: int = 0
+    last_end: int = -1
+    for match in _DECORATOR_RE.finditer(file_content):
+        line_no += file_content.count('\n', last_pos, match.start())
+        last_pos = match.start()
+        if line_no <= last_end:
+            # Still inside the previous declaration
+            continue
         
-        i += 1
+        extractor, key = _DECORATOR_HANDLERS[match.group(1)]
+        info = extractor(file_content, match.start(), line_no, jsdoc_index)
+        if info:
+            doc[key].append(info)
+            last_end = info.end_line
+    
+    # Records become plain dicts once, for JSON serialization
+    for key in ("properties", "events", "methods"):
+        doc[key] = [info.to_dict() for info in doc[key]]
     
     # Extract slots from render function
-    slots = extract_slots(lines)
+    slots = extract_slots(file_content)
     doc["slots"] = slots
     
     return doc
 
-def extract_component_description(lines: List[str]) -> str:
+def extract_component_description(file_content: str,
+                                  jsdoc_index: Optional[Dict[int, Tuple[int, int]]] = None) -> str:
     """Extract component description from JSDoc before @Component."""
-    for i, line in enumerate(lines):
-        if "@Component" in line:
-            # Look backwards for JSDoc
-            j = i - 1
-            while j >= 0 and lines[j].strip() == "":
-                j -= 1
-            if j >= 0 and lines[j].strip().endswith("*/"):
-                k = j
-                while k >= 0 and not lines[k].strip().startswith("/**"):
-                    k -= 1
-                if k >= 0:
-                    jsdoc_lines = [lines[l] for l in range(k, j+1)]
-                    clean_lines = []
-                    for line in jsdoc_lines:
-                        clean = line.strip().lstrip('/*').lstrip('*').rstrip('*/').strip()
-                        if clean and not clean.startswith('@'):
-                            clean_lines.append(clean)
-                    return " ".join(clean_lines)
-            break
-    return ""
-
-def extract_prop_info(lines: List[str], start_idx: int) -> Optional[Dict[str, Any]]:
-    """Extract property information from @Prop decorator."""
-    jsdoc_description = _extract_jsdoc_before_line(lines, start_idx)
-    
-    # Collect property declaration lines until semicolon
-    prop_lines = []
-    j = start_idx
-    while j < len(lines):
-        prop_lines.append(lines[j])
-        if ';' in lines[j]:
-            break
-        j += 1
-    
-    prop_text = ' '.join(prop_lines).strip()
+    comp = file_content.find("@Component")
+    if comp < 0:
+        return ""
+    return _jsdoc_for_line(file_content, file_content.rfind('\n', 0, comp) + 1, jsdoc_index)
+
+def extract_prop_info(file_content: str, start: int, start_line: int,
+                      jsdoc_index: Optional[Dict[int, Tuple[int, int]]] = None) -> Optional[PropInfo]:
+    """Extract property information from the @Prop decorator on the line starting at offset start."""
+    # The declaration runs to the end of the first line containing a semicolon;
+    # without one nearby the patterns cannot match, so bail out early
+    semi: int = file_content.find(';', start, start + _SCAN_WINDOW)
+    if semi < 0:
+        return None
+    end: int = _line_end(file_content, semi)
+    j: int = start_line + file_content.count('\n', start, semi)
+    jsdoc_description: str = _jsdoc_for_line(file_content, start, jsdoc_index)
     
     # Extract mutable flag
-    mutable = 'mutable: true' in prop_text
+    mutable: bool = _MUTABLE_RE.search(file_content, start, end) is not None
     
     # Updated regex to handle properties with or without explicit type annotations
     # Handles both: @Prop() propName: type = default; and @Prop() propName = default;
-    prop_match = re.search(r'@Prop\([^)]*\)\s*(\w+[?!]?)\s*(?::\s*([^=;]+?))?\s*=\s*([^;]+?);', prop_text, re.DOTALL)
+    # Patterns run in place on the declaration's span (which may cover several
+    # lines); only the captured pieces are copied and single-spaced
+    prop_match = _PROP_RE.search(file_content, start, end)
     if not prop_match:
         # Try pattern with type but no default
-        prop_match = re.search(r'@Prop\([^)]*\)\s*(\w+[?!]?)\s*:\s*([^=;]+?);', prop_text, re.DOTALL)
+        prop_match = _PROP_RE_NODEFAULT.search(file_content, start, end)
     
     if prop_match:
-        prop_name = prop_match.group(1).replace('?', '').replace('!', '')
+        prop_name: str = prop_match.group(1).replace('?', '').replace('!', '')
+        prop_type: str
+        prop_default: Optional[str]
         
         # Handle different match patterns
         if prop_match.lastindex == 3:  # Has default value
             if prop_match.group(2):  # Has explicit type
-                prop_type = prop_match.group(2).strip()
+                prop_type = ' '.join(prop_match.group(2).split())
             else:  # No explicit type, infer from default
-                prop_default = prop_match.group(3).strip()
+                prop_default = ' '.join(prop_match.group(3).split())
                 # Infer type from default value
-                if prop_default == 'true' or prop_default == 'false':
+                if prop_default in ('true', 'false'):
                     prop_type = 'boolean'
-                elif prop_default.startswith("'") or prop_default.startswith('"'):
+                elif prop_default.startswith(("'", '"')):
                     prop_type = 'string'
-                elif prop_default.replace('.', '').replace('-', '').isdigit():
+                elif _NUMLIT_RE.fullmatch(prop_default):
                     prop_type = 'number'
                 else:
                     prop_type = 'any'
-            prop_default = prop_match.group(3).strip()
+            prop_default = ' '.join(prop_match.group(3).split())
         elif prop_match.lastindex == 2:  # Has type but no default
-            prop_type = prop_match.group(2).strip()
+            prop_type = ' '.join(prop_match.group(2).split())
             prop_default = None
         else:
             prop_type = 'any'
             prop_default = None
         
-        return {
-            "name": prop_name,
-            "type": prop_type,
-            "description": jsdoc_description,
-            "default": prop_default,
-            "mutable": mutable,
-            "end_line": j
-        }
+        return PropInfo(
+            name=prop_name,
+            type=prop_type,
+            description=jsdoc_description,
+            default=prop_default,
+            mutable=mutable,
+            end_line=j
+        )
     return None
 
-def extract_event_info(lines: List[str], start_idx: int) -> Optional[Dict[str, Any]]:
-    """Extract event information from @Event or @StencilEvent decorator."""
-    jsdoc_description = _extract_jsdoc_before_line(lines, start_idx)
-    
-    # Collect all lines until we find a line ending with "};" or ">;"
-    event_lines = []
-    j = start_idx
-    while j < len(lines):
-        event_lines.append(lines[j])
-        if lines[j].strip().endswith('};') or lines[j].strip().endswith('>;'):
-            break
-        j += 1
-    
-    event_text = ' '.join(event_lines).strip()
+def extract_event_info(file_content: str, start: int, start_line: int,
+                       jsdoc_index: Optional[Dict[int, Tuple[int, int]]] = None) -> Optional[EventInfo]:
+    """Extract event information from the @Event or @StencilEvent decorator on the line starting at offset start."""
+    # The declaration runs until a line ending with "};" or ">;". The search
+    # window is widened to a whole line so "$" never matches mid-line
+    window_end: int = _line_end(file_content, min(start + _SCAN_WINDOW, len(file_content)))
+    terminator = _EVENT_END_RE.search(file_content, start, window_end)
+    if not terminator:
+        return None
+    end: int = terminator.end()
+    j: int = start_line + file_content.count('\n', start, terminator.start())
+    jsdoc_description: str = _jsdoc_for_line(file_content, start, jsdoc_index)
+    
+    event_text: str = file_content[start:end].replace('\n', ' ').strip()
     
     # Extract event name and detail type - handle both @Event and @StencilEvent
-    name_match = re.search(r'@(?:Event|StencilEvent)\(\)\s*(\w+)!?', event_text)
-    emitter_match = re.search(r'EventEmitter<(.+?)>', event_text, re.DOTALL)
+    name_match = _EVENT_RE.search(event_text)
+    emitter_match = _EMITTER_RE.search(event_text)
     
     if name_match:
-        event_name = name_match.group(1)
-        event_detail = "void"
+        event_name: str = name_match.group(1)
+        event_detail: str = "void"
         
         if emitter_match:
-            event_detail = emitter_match.group(1).strip()
-            event_detail = re.sub(r'\s+', ' ', event_detail)  # Clean up whitespace
+            event_detail = ' '.join(emitter_match.group(1).split())  # Clean up whitespace
         
-        return {
-            "name": event_name,
-            "detail": event_detail,
-            "description": jsdoc_description,
-            "end_line": j
-        }
+        return EventInfo(
+            name=event_name,
+            detail=event_detail,
+            description=jsdoc_description,
+            end_line=j
+        )
     return None
 
-def extract_method_info(lines: List[str], start_idx: int) -> Optional[Dict[str, Any]]:
-    """Extract method information from @Method decorator."""
-    jsdoc_description = _extract_jsdoc_before_line(lines, start_idx)
-    
-    # Collect method signature lines
-    method_lines = []
-    j = start_idx + 1
-    brace_count = 0
-    found_signature = False
-    
-    while j < len(lines):
-        line = lines[j]
-        method_lines.append(line)
-        
-        # Count braces to find complete method signature
-        if '(' in line:
+def extract_method_info(file_content: str, start: int, start_line: int,
+                        jsdoc_index: Optional[Dict[int, Tuple[int, int]]] = None) -> Optional[MethodInfo]:
+    """Extract method information from the @Method decorator on the line starting at offset start."""
+    # The signature starts on the line after the decorator
+    signature_start: int = file_content.find('\n', start) + 1
+    if not signature_start:
+        return None
+    
+    # Count braces line by line to find the complete method signature,
+    # giving up once the scan leaves the window
+    limit: int = start + _SCAN_WINDOW
+    j: int = start_line + 1
+    pos: int = signature_start
+    brace_count: int = 0
+    found_signature: bool = False
+    while True:
+        end = _line_end(file_content, pos)
+        opens = file_content.count('(', pos, end)
+        if opens:
             found_signature = True
-            brace_count += line.count('(')
-        if ')' in line:
-            brace_count -= line.count(')')
+            brace_count += opens
+        brace_count -= file_content.count(')', pos, end)
         
         if found_signature and brace_count == 0:
             break
         j += 1
+        if end == len(file_content):
+            break
+        pos = end + 1
+        if pos >= limit:
+            return None
     
-    method_text = ' '.join(method_lines).strip()
+    jsdoc_description: str = _jsdoc_for_line(file_content, start, jsdoc_index)
+    method_text: str = file_content[signature_start:end].replace('\n', ' ').strip()
     
     # Extract method name, parameters, and return type
-    method_match = re.search(r'(?:async\s+)?(\w+)\s*\(([^)]*)\)(?:\s*:\s*([^{]+?))?(?:\s*{)?', method_text)
+    method_match = _METHOD_RE.search(method_text)
     if method_match:
-        method_name = method_match.group(1)
-        method_params = method_match.group(2).strip() if method_match.group(2) else ""
-        method_return = method_match.group(3).strip() if method_match.group(3) else "void"
+        method_name: str = method_match.group(1)
+        method_params: str = method_match.group(2).strip() if method_match.group(2) else ""
+        method_return: str = method_match.group(3).strip() if method_match.group(3) else "void"
         
-        return {
-            "name": method_name,
-            "signature": f"({method_params})",
-            "parameters": method_params,
-            "returnType": method_return,
-            "description": jsdoc_description,
-            "end_line": j
-        }
+        return MethodInfo(
+            name=method_name,
+            signature=f"({method_params})",
+            parameters=method_params,
+            return_type=method_return,
+            description=jsdoc_description,
+            end_line=j
+        )
     return None
 
-def extract_slots(lines: List[str]) -> List[Dict[str, str]]:
+def extract_slots(file_content: str) -> List[Dict[str, str]]:
     """Extract slots from render function."""
-    slots = []
-    in_render = False
-    
-    for line in lines:
-        if 'render()' in line:
-            in_render = True
-        if in_render and ('</Host>' in line or 'return' in line and '}' in line):
-            in_render = False
-        if in_render:
-            slot_matches = re.findall(r'<slot\s*(?:name="([^"]*)")?', line)
-            for match in slot_matches:
-                slot_name = match if match else "default"
-                if not any(slot["name"] == slot_name for slot in slots):
-                    slots.append({
-                        "name": slot_name,
-                        "description": f"Slot for {slot_name} content"
-                    })
+    slots: List[Dict[str, str]] = []
+    seen: set = set()
+    
+    # A render block runs from the line containing "render()" up to the line
+    # closing it with "</Host>" or a "return ... }"
+    start = file_content.find('render()')
+    while start >= 0:
+        start = file_content.rfind('\n', 0, start) + 1
+        end_match = _RENDER_END_RE.search(file_content, start)
+        end = end_match.start() if end_match else len(file_content)
+        
+        for match in _SLOT_RE.finditer(file_content, start, end):
+            slot_name = match.group(1) or "default"
+            if slot_name not in seen:
+                seen.add(slot_name)
+                slots.append({
+                    "name": slot_name,
+                    "description": f"Slot for {slot_name} content"
+                })
+        
+        if not end_match:
+            break
+        start = file_content.find('render()', _line_end(file_content, end) + 1)
     return slots
 
-def _extract_jsdoc_before_line(lines: List[str], line_index: int) -> str:
-    """Extract JSDoc comment before a given line."""
-    jsdoc_description = ""
-    j = line_index - 1
-    while j >= 0 and lines[j].strip() == "":
-        j -= 1
-    if j >= 0 and lines[j].strip().endswith("*/"):
-        k = j
-        while k >= 0 and not lines[k].strip().startswith("/**"):
-            k -= 1
-        if k >= 0:
-            jsdoc_lines = [lines[l] for l in range(k, j+1)]
-            clean_lines = []
-            for jsdoc_line in jsdoc_lines:
-                clean = jsdoc_line.strip().lstrip('/*').lstrip('*').rstrip('*/').strip()
-                if clean and not clean.startswith('@'):
-                    clean_lines.append(clean)
-            jsdoc_description = " ".join(clean_lines)
-    return jsdoc_description
-
-def extract_story_examples(story_file_path: str) -> Dict[str, Any]:
+# Decorator name -> (extractor, doc key)
+_DECORATOR_HANDLERS = {
+    "Prop": (extract_prop_info, "properties"),
+    "Event": (extract_event_info, "events"),
+    "StencilEvent": (extract_event_info, "events"),
+    "Method": (extract_method_info, "methods"),
+}
+
+def _index_jsdoc(file_content: str) -> Dict[int, Tuple[int, int]]:
+    """
+    Map the start offset of the first non-blank line below each JSDoc block to
+    the span of the block's text. Only blocks whose "/**" starts a line and
+    whose "*/" ends one are indexed; the text is cleaned on lookup.
+    """
+    index: Dict[int, Tuple[int, int]] = {}
+    pos = 0
+    while True:
+        start = file_content.find('/**', pos)
+        if start < 0:
+            break
+        close = file_content.find('*/', start + 2)
+        if close < 0:
+            break
+        pos = close + 2
+        line_start = file_content.rfind('\n', 0, start) + 1
+        line_end = _line_end(file_content, pos)
+        if file_content[line_start:start].strip() or file_content[pos:line_end].strip():
+            continue
+        below = _NONBLANK_RE.search(file_content, line_end)
+        if below:
+            anchor = file_content.rfind('\n', 0, below.start()) + 1
+            index[anchor] = (start + 3, close)
+    return index
+
+def _jsdoc_for_line(file_content: str, line_start: int,
+                    jsdoc_index: Optional[Dict[int, Tuple[int, int]]]) -> str:
+    """JSDoc description for the line starting at line_start."""
+    if jsdoc_index is None:
+        jsdoc_index = _index_jsdoc(file_content)
+    span = jsdoc_index.get(line_start)
+    if span is None:
+        return ""
+    return _clean_jsdoc_block(file_content[span[0]:span[1]].split('\n'))
+
+def _line_end(file_content: str, pos: int) -> int:
+    """Offset of the newline ending the line that contains pos (or the end of the text)."""
+    end = file_content.find('\n', pos)
+    return end if end >= 0 else len(file_content)
+
+def _clean_jsdoc_block(jsdoc_lines: List[str]) -> str:
+    """Join the text of JSDoc lines, dropping comment markers and @tag lines."""
+    clean_lines = [
+        m.group(1) for line in jsdoc_lines
+        if (m := _JSDOC_LINE_RE.match(line)) and m.group(1) and not m.group(1).startswith('@')
+    ]
+    return " ".join(clean_lines)
+
+def extract_story_examples(story_file_path: str, story_content: Optional[str] = None) -> Dict[str, Any]:
     """
     Extract examples from Storybook story files.
     
     Args:
         story_file_path: Path to the .stories.ts file
+        story_content: Contents of the story file, if the caller has already read it
         
     Returns:
         Dictionary containing story examples and usage patterns
     """
-    if not os.path.exists(story_file_path):
-        return {}
-    
-    with open(story_file_path, 'r', encoding='utf-8') as f:
-        story_content = f.read()
+    if story_content is None:
+        if not os.path.exists(story_file_path):
+            return {}
+        
+        with open(story_file_path, 'r', encoding='utf-8') as f:
+            story_content = f.read()
     
-    examples = {
+    examples: Dict[str, Any] = {
         "basic": None,
         "variations": [],
         "args": {},
@@ -304,45 +442,104 @@ def extract_story_examples(story_file_path: str) -> Dict[str, Any]:
     }
     
     # Extract default args
-    args_match = re.search(r'args:\s*{([^}]+)}', story_content, re.DOTALL)
-    if args_match:
-        args_text = args_match.group(1)
+    args_text = _object_body(story_content, _ARGS_RE)
+    if args_text:
         # Parse args into dictionary
-        arg_matches = re.findall(r"'?(\w+)'?\s*:\s*([^,]+)(?:,|$)", args_text)
-        for key, value in arg_matches:
+        for key, value in _arg_entries(args_text):
             examples["args"][key] = value.strip()
     
     # Extract argTypes (control definitions)
-    argTypes_match = re.search(r'argTypes:\s*{([^}]+)}', story_content, re.DOTALL)
-    if argTypes_match:
-        argTypes_text = argTypes_match.group(1)
-        argType_matches = re.findall(r"(\w+):\s*{([^}]+)}", argTypes_text)
-        for key, value in argType_matches:
-            control_match = re.search(r'control:\s*{\s*type:\s*[\'"](\w+)[\'"]', value)
+    argTypes_text = _object_body(story_content, _ARGTYPES_RE)
+    if argTypes_text:
+        for key, value in _argtype_entries(argTypes_text):
+            control_match = _CONTROL_RE.search(value)
             if control_match:
                 examples["argTypes"][key] = {
                     "control": control_match.group(1),
                     "options": []
                 }
                 # Extract options if present
-                options_match = re.search(r'options:\s*\[([^\]]+)\]', value)
+                options_match = _OPTIONS_RE.search(value)
                 if options_match:
                     options = [opt.strip().strip("'\"") for opt in options_match.group(1).split(',')]
                     examples["argTypes"][key]["options"] = options
     
     # Extract template example
-    template_match = re.search(r'return html`([^`]+)`', story_content, re.DOTALL)
+    template_match = _TEMPLATE_RE.search(story_content)
     if template_match:
         examples["basic"] = template_match.group(1).strip()
     
     # Extract event handlers
-    events_match = re.search(r'handles:\s*\[([^\]]+)\]', story_content)
+    events_match = _HANDLES_RE.search(story_content)
     if events_match:
         events = [evt.strip().strip("'\"") for evt in events_match.group(1).split(',')]
         examples["events"] = events
     
     return examples
 
+def _find_balanced(text: str, start_idx: int, open_ch: str = '{', close_ch: str = '}') -> Optional[Tuple[int, int]]:
+    """
+    Find the bracket pair that opens at start_idx, allowing nested pairs.
+    
+    Args:
+        text: Text to scan
+        start_idx: Offset of the opening bracket
+        open_ch: Opening bracket character
+        close_ch: Closing bracket character
+        
+    Returns:
+        (start, end) offsets of the opening and closing brackets, or None if unbalanced
+    """
+    depth = 0
+    pos = start_idx
+    while True:
+        close = text.find(close_ch, pos)
+        if close < 0:
+            return None
+        depth += text.count(open_ch, pos, close) - 1
+        if depth == 0:
+            return start_idx, close
+        pos = close + 1
+
+def _object_body(text: str, label_re: re.Pattern) -> Optional[str]:
+    """Body of the first non-empty object literal whose "label: {" matches label_re."""
+    for match in label_re.finditer(text):
+        span = _find_balanced(text, match.end() - 1)
+        if span and span[1] > span[0] + 1:
+            return text[span[0] + 1:span[1]]
+    return None
+
+def _arg_entries(args_text: str) -> Iterator[Tuple[str, str]]:
+    """Yield (key, value) for each top-level entry of an args object; nested objects and arrays stay whole."""
+    pos = 0
+    while True:
+        match = _ARG_RE.search(args_text, pos)
+        if not match:
+            return
+        key, value = match.groups()
+        pos = match.end()
+        stripped = value.lstrip()
+        if stripped[:1] in _BRACKET_PAIRS:
+            value_start = match.end(2) - len(stripped)
+            span = _find_balanced(args_text, value_start, stripped[0], _BRACKET_PAIRS[stripped[0]])
+            if span:
+                value = args_text[value_start:span[1] + 1]
+                pos = span[1] + 1
+        yield key, value
+
+def _argtype_entries(argTypes_text: str) -> Iterator[Tuple[str, str]]:
+    """Yield (key, body) for each "key: { ... }" entry of an argTypes object."""
+    pos = 0
+    while True:
+        match = _ARGTYPE_ENTRY_RE.search(argTypes_text, pos)
+        if not match:
+            return
+        span = _find_balanced(argTypes_text, match.end() - 1)
+        if not span:
+            return
+        yield match.group(1), argTypes_text[span[0] + 1:span[1]]
+        pos = span[1] + 1
+
 def generate_usage_scripts(component_doc: Dict[str, Any]) -> List[Dict[str, str]]:
     """
     Generate common usage scripts for the component based on its properties and events.
@@ -353,11 +550,11 @@ def generate_usage_scripts(component_doc: Dict[str, Any]) -> List[Dict[str, str]
     Returns:
         List of usage script examples
     """
-    scripts = []
+    scripts: List[Dict[str, str]] = []
     tag_name = component_doc.get("tag", "modus-component")
     
     # Basic usage example
-    basic_props = []
+    basic_props: List[str] = []
     for prop in component_doc.get("properties", []):
         if prop.get("default") is None and "?" not in str(prop.get("type", "")):
             # Required prop
@@ -372,7 +569,7 @@ def generate_usage_scripts(component_doc: Dict[str, Any]) -> List[Dict[str, str]
     
     # Event handling example
     if component_doc.get("events"):
-        event_handlers = []
+        event_handlers: List[str] = []
         for event in component_doc["events"]:
             event_name = event["name"]
             handler_name = f'handle{event_name[0].upper() + event_name[1:]}'
@@ -408,79 +605,200 @@ def get_component_documentation(component_name: str) -> Dict[str, Any]:
     """
     Get enhanced parsed documentation for a specific component including story examples.
     
+    Parsed results are memoized per source modification time, so the returned
+    dictionary may be shared between calls and must not be modified.
+    
     Args:
         component_name: Name of the component (e.g., 'modus-wc-table')
         
     Returns:
         Dictionary containing enhanced component documentation or error message
     """
-    # Get the project root directory (go up from scripts/src/ to project root)
-    script_dir = os.path.dirname(os.path.abspath(__file__))  # scripts/src/
-    scripts_dir = os.path.dirname(script_dir)  # scripts/
-    project_root = os.path.dirname(scripts_dir)  # project root
-    
-    # Path to the Modus 2.0 source
-    modus_src_path = os.path.join(project_root, "data", "modus-wc-2.0", "src", "components", component_name)
+    modus_src_path = _component_src_path(component_name)
     
     # Component source file
     component_file = os.path.join(modus_src_path, f"{component_name}.tsx")
     
-    if not os.path.exists(component_file):
+    try:
+        tsx_mtime = os.stat(component_file).st_mtime_ns
+    except OSError:
         # Fallback to cached JSON if source not available
-        component_docs_path = os.path.join(project_root, f"component-docs/{component_name}.json")
+        component_docs_path = os.path.join(_PROJECT_ROOT, f"component-docs/{component_name}.json")
         
         if not os.path.exists(component_docs_path):
             return {"error": f"Documentation for '{component_name}' not found."}
             
         try:
-            with open(component_docs_path, "r") as f:
-                documentation = json.load(f)
+            with open(component_docs_path, "rb") as f:
+                documentation = _load_json(f.read())
                 return documentation
         except Exception as e:
             return {"error": f"Failed to load documentation for '{component_name}': {str(e)}"}
     
     try:
-        # Parse component source
-        with open(component_file, 'r', encoding='utf-8') as f:
-            component_content = f.read()
-        
-        doc = parse_stencil_component(component_content)
-        
-        # Add component tag name
-        doc["tag"] = component_name
-        
-        # Extract story examples if available
-        story_file = os.path.join(modus_src_path, f"{component_name}.stories.ts")
-        if os.path.exists(story_file):
-            # Get the full story file content
-            with open(story_file, 'r', encoding='utf-8') as f:
-                story_content = f.read()
-            
-            # Extract structured examples
-            doc["examples"] = extract_story_examples(story_file)
-            
-            # Add the full story content for complete reference
-            doc["storyExample"] = {
-                "template": doc["examples"].get("basic", ""),
-                "args": doc["examples"].get("args", {}),
-                "argTypes": doc["examples"].get("argTypes", {}),
-                "events": doc["examples"].get("events", []),
-                "fullContent": story_content  # Include the complete story file
-            }
-        
-        # Add usage scripts for common patterns
-        doc["scripts"] = generate_usage_scripts(doc)
-        
+        stories_mtime = os.stat(os.path.join(modus_src_path, f"{component_name}.stories.ts")).st_mtime_ns
+    except OSError:
+        stories_mtime = None
+    
+    try:
+        return _get_doc_cached(component_name, tsx_mtime, stories_mtime)
+    except Exception as e:
+        # Built here rather than in _get_doc_cached, whose results are memoized,
+        # so a one-off failure (e.g. a read racing an update) isn't remembered
+        return {"error": f"Failed to parse component '{component_name}': {str(e)}"}
+
+def _component_src_path(component_name: str) -> str:
+    """Directory holding a component's Modus 2.0 sources."""
+    return os.path.join(_PROJECT_ROOT, "data", "modus-wc-2.0", "src", "components", component_name)
+
+@functools.lru_cache(maxsize=256)
+def _get_doc_cached(component_name: str, tsx_mtime: int, stories_mtime: Optional[int]) -> Dict[str, Any]:
+    """Parse a component's sources; the mtimes only key the memoization. Failures raise, so they aren't memoized."""
+    modus_src_path = _component_src_path(component_name)
+    component_file = os.path.join(modus_src_path, f"{component_name}.tsx")
+    
+    # Parse component source
+    with open(component_file, 'r', encoding='utf-8') as f:
+        component_content = f.read()
+    
+    story_file = os.path.join(modus_src_path, f"{component_name}.stories.ts")
+    story_content = None
+    if stories_mtime is not None:
+        # The story source is part of the cache key
+        with open(story_file, 'r', encoding='utf-8') as f:
+            story_content = f.read()
+    
+    # Unchanged sources reuse the result of an earlier parse
+    cache_file = _parse_cache_path(_PROJECT_ROOT, component_name, component_content, story_content)
+    doc = _load_cached_doc(cache_file)
+    if doc is not None:
         return doc
+    
+    doc = parse_stencil_component(component_content)
+    
+    # Add component tag name
+    doc["tag"] = component_name
+    
+    # Extract story examples if available
+    if story_content is not None:
+        # Extract structured examples
+        doc["examples"] = extract_story_examples(story_file, story_content)
         
+        # Summarize the story for quick reference; the raw source stays in the
+        # .stories.ts file rather than being copied into every doc
+        doc["storyExample"] = {
+            "template": doc["examples"].get("basic", ""),
+            "args": doc["examples"].get("args", {}),
+            "argTypes": doc["examples"].get("argTypes", {}),
+            "events": doc["examples"].get("events", [])
+        }
+    
+    # Add usage scripts for common patterns
+    doc["scripts"] = generate_usage_scripts(doc)
+    
+    _store_cached_doc(cache_file, component_name, doc)
+    return doc
+
+@functools.lru_cache(maxsize=1)
+def _parser_fingerprint() -> bytes:
+    """Digest of this module's source, so parser changes invalidate cached results."""
+    with open(__file__, 'rb') as f:
+        return hashlib.sha256(f.read()).digest()
+
+def _parse_cache_path(project_root: str, component_name: str, component_content: str,
+                      story_content: Optional[str]) -> str:
+    """Path of the on-disk parse cache entry for the given component sources."""
+    key = hashlib.sha256(_parser_fingerprint())
+    key.update(component_name.encode('utf-8') + b'\0')
+    key.update(component_content.encode('utf-8'))
+    if story_content is not None:
+        key.update(b'\0' + story_content.encode('utf-8'))
+    # Named after the component (tags have no dots) so older entries for it can be pruned
+    return os.path.join(project_root, "component-docs", ".cache", f"{component_name}.{key.hexdigest()}.json")
+
+def _dump_json(obj: Any, pretty: bool = True) -> bytes:
+    """Serialize to UTF-8 JSON (2-space indented unless pretty is False), using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else 0)
+    if pretty:
+        return json.dumps(obj, indent=2).encode('utf-8')
+    return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+def _load_json(data: bytes) -> Any:
+    """Parse JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def _load_cached_doc(cache_file: str) -> Optional[Dict[str, Any]]:
+    """Load a cached parse result, or None if there is no usable entry."""
+    try:
+        with open(cache_file, 'rb') as f:
+            return _load_json(f.read())
+    except (OSError, ValueError):
+        return None
+
+def _store_cached_doc(cache_file: str, component_name: str, doc: Dict[str, Any]) -> None:
+    """
+    Write a parse result to the cache; a failed write only costs a re-parse later.
+    
+    Each component keeps only its newest entry: ones written for older sources
+    or an older parser can never be hit again, so they are deleted here.
+    """
+    tmp_file = f"{cache_file}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+        with open(tmp_file, 'wb', buffering=_WRITE_BUFFER_SIZE) as f:
+            # Cache entries are never read by people, so skip the whitespace
+            f.write(_dump_json(doc, pretty=False))
+        # Atomic rename so concurrent readers never see a partial entry
+        os.replace(tmp_file, cache_file)
+    except OSError:
+        try:
+            os.remove(tmp_file)
+        except OSError:
+            pass
+        return
+    _prune_cache_entries(cache_file, component_name)
+
+def _prune_cache_entries(cache_file: str, component_name: str) -> None:
+    """Delete the component's cache entries other than cache_file."""
+    cache_dir, keep = os.path.split(cache_file)
+    prefix = f"{component_name}."
+    try:
+        with os.scandir(cache_dir) as entries:
+            stale = [entry.path for entry in entries
+                     if entry.name != keep and entry.name.startswith(prefix) and
+                     entry.name.endswith('.json')]
+    except OSError:
+        return
+    for path in stale:
+        try:
+            os.remove(path)
+        except OSError:  # e.g. already removed by another worker
+            pass
+
+def _parse_and_write(item: str) -> Optional[str]:
+    """Parse one component and save it to component-docs; returns an error message on failure."""
+    try:
+        doc = get_component_documentation(item)
+        if "error" in doc:
+            return f"{item}: {doc['error']}"
+        # Save to component-docs directory
+        output_file = os.path.join("component-docs", f"{item}.json")
+        with open(output_file, 'wb', buffering=_WRITE_BUFFER_SIZE) as f:
+            f.write(_dump_json(doc))
+        return None
     except Exception as e:
-        return {"error": f"Failed to parse component '{component_name}': {str(e)}"}
+        return f"{item}: {str(e)}"
 
-def update_component_data_cache():
+def update_component_data_cache() -> Dict[str, Any]:
     """
     Update the cached component data by parsing all available components.
     This should be called when component source files are updated.
     
+    Components are independent, so they are parsed in parallel worker processes.
+    
     Returns:
         Dictionary with update status and component count
     """
@@ -489,27 +807,36 @@ def update_component_data_cache():
     if not os.path.exists(components_dir):
         return {"error": f"Components directory not found: {components_dir}"}
     
-    updated_components = []
-    errors = []
+    updated_components: List[str] = []
+    errors: List[str] = []
     
     # Find all component directories
-    for item in os.listdir(components_dir):
-        component_dir = os.path.join(components_dir, item)
-        if os.path.isdir(component_dir):
-            component_file = os.path.join(component_dir, f"{item}.tsx")
-            if os.path.exists(component_file):
+    component_items: List[str] = []
+    with os.scandir(components_dir) as entries:
+        for entry in entries:
+            # DirEntry caches the directory check, leaving one stat for the .tsx
+            if entry.is_dir():
+                component_file = os.path.join(entry.path, f"{entry.name}.tsx")
+                if os.path.exists(component_file):
+                    component_items.append(entry.name)
+    
+    if component_items:
+        with ProcessPoolExecutor() as executor:
+            futures = {executor.submit(_parse_and_write, item): item for item in component_items}
+            for future in as_completed(futures):
+                item = futures[future]
                 try:
-                    doc = get_component_documentation(item)
-                    if "error" not in doc:
-                        # Save to component-docs directory
-                        output_file = os.path.join("component-docs", f"{item}.json")
-                        with open(output_file, 'w') as f:
-                            json.dump(doc, f, indent=2)
-                        updated_components.append(item)
-                    else:
-                        errors.append(f"{item}: {doc['error']}")
+                    error = future.result()
                 except Exception as e:
-                    errors.append(f"{item}: {str(e)}")
+                    error = f"{item}: {str(e)}"
+                if error:
+                    errors.append(error)
+                else:
+                    updated_components.append(item)
+    
+    # Completion order is arbitrary; report in a stable order
+    updated_components.sort()
+    errors.sort()
     
     return {
         "updated_components": updated_components,
@@ -521,8 +848,8 @@ if __name__ == "__main__":
     # Test the parser
     result = get_component_documentation("modus-wc-table")
     # Save the result to JSON
-    with open('component-docs/modus-wc-select.json', 'w') as f:
-        json.dump(result, f, indent=2)
+    with open('component-docs/modus-wc-select.json', 'wb', buffering=_WRITE_BUFFER_SIZE) as f:
+        f.write(_dump_json(result))
     
     # Commented out print statements
     # print(f"Properties: {len(result.get('properties', []))}")
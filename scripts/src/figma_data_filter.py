@@ -3,8 +3,143 @@ Figma Data Filter
 Filters unnecessary data from Figma API responses for LLM consumption
 """
 
-from typing import Dict, Any, List, Set, Optional
+from typing import Dict, Any, Callable, FrozenSet, List, Set, Optional, Tuple
+import functools
 import json
+import re
+
+try:
+    import orjson
+except ImportError:  # Fall back to the stdlib encoder if orjson isn't installed
+    orjson = None  # type: ignore[assignment]
+
+# What filter_figma_data does with a property, looked up once per key
+_KEEP = 0
+_SIMPLIFY = 1
+_CHILDREN = 2
+_REMOVE = 3
+_OTHER = 4
+
+# Marks a property the filter leaves out
+_DROP = object()
+
+# A filter_figma_data work-stack frame, see there
+_Frame = Tuple[Any, Optional[int], List[Dict[str, Any]],
+               Optional[Tuple[Dict[str, Any], int, int, bool]]]
+
+# Keys _finish_node adds to a filtered node
+_MARKER_KEYS = ('_simplified', '_hint', '_layout_hint')
+
+_compact_encoder = json.JSONEncoder(separators=(',', ':'), default=str)
+
+
+def _json_size(value: Any) -> int:
+    """Approximate length of value as compact JSON; only containers are actually serialized"""
+    if isinstance(value, str):
+        return len(value) + 2
+    if isinstance(value, (dict, list)):
+        if orjson is not None:
+            try:
+                return len(orjson.dumps(value, default=str, option=orjson.OPT_NON_STR_KEYS))
+            except TypeError:  # e.g. integers wider than 64 bits
+                pass
+        return len(_compact_encoder.encode(value))
+    # Numbers; True/False/None are as long as true/false/null
+    return len(str(value))
+
+
+def _estimated_size(value: Any) -> int:
+    """
+    Estimated length of value as compact JSON, without serializing it
+    
+    Used for values the filter leaves out (removed payloads, hidden subtrees).
+    Dicts are walked in full, but each list is measured by its first element
+    times its length, so a large vector network or subtree costs only a walk
+    down its first elements. Exact for scalars, dicts of scalars and lists
+    of same-sized items (ignoring string escapes).
+    """
+    size = 0
+    # (container, number of times it counts)
+    stack: List[Tuple[Any, int]] = [(value, 1)]
+    push = stack.append
+    while stack:
+        item, weight = stack.pop()
+        if isinstance(item, dict):
+            if not item:
+                size += weight * 2
+                continue
+            # "{}", commas between items, and quotes plus a colon per key;
+            # scalar values are counted here, containers queued
+            item_size = 1 + 4 * len(item) + sum(map(len, map(str, item)))
+            for val in item.values():
+                if isinstance(val, str):
+                    item_size += len(val) + 2
+                elif isinstance(val, (dict, list)):
+                    push((val, weight))
+                else:
+                    item_size += len(repr(val))
+            size += weight * item_size
+        elif isinstance(item, list):
+            if item:
+                # "[]", commas between items, and the items themselves
+                size += weight * (1 + len(item))
+                push((item[0], weight * len(item)))
+            else:
+                size += weight * 2
+        elif isinstance(item, str):
+            size += weight * (len(item) + 2)
+        else:
+            # Numbers; True/False/None are as long as true/false/null
+            size += weight * len(repr(item))
+    return size
+
+
+@functools.lru_cache(maxsize=1024)
+def _rgb_str(r: float, g: float, b: float, opacity: float = 1.0) -> str:
+    """CSS color for 0-1 Figma channels; palettes repeat, so results are cached"""
+    r8 = int(r * 255)
+    g8 = int(g * 255)
+    b8 = int(b * 255)
+    if opacity < 1:
+        return f"rgba({r8},{g8},{b8},{opacity:.2f})"
+    return f"rgb({r8},{g8},{b8})"
+
+
+def _rgb(color: Dict[str, Any], opacity: float = 1.0) -> str:
+    """CSS color for a Figma color dict"""
+    return _rgb_str(color.get('r', 0), color.get('g', 0), color.get('b', 0), opacity)
+
+
+def _approx_size(value: Any, limit: int) -> int:
+    """
+    Length of str(value), counted only until it exceeds limit
+    
+    Walks the structure instead of building its repr, so a large subtree
+    costs no more than the first few elements needed to pass the limit.
+    The result is exact up to limit; past it, any value greater than limit.
+    """
+    size = 0
+    stack: List[Any] = [value]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, dict):
+            # "{}" plus ", " between items and ": " inside each
+            size += 4 * len(item) if item else 2
+            for key, val in item.items():
+                stack.append(key)
+                stack.append(val)
+        elif isinstance(item, list):
+            # "[]" plus ", " between items
+            size += 2 * len(item) if item else 2
+            stack.extend(item)
+        elif isinstance(item, str) and len(item) > limit:
+            return limit + 1
+        else:
+            size += len(repr(item))
+        if size > limit:
+            return size
+    return size
+
 
 class FigmaDataFilter:
     """
@@ -12,9 +147,20 @@ class FigmaDataFilter:
     Optimized for LLM analysis while preserving layout and component information
     """
     
-    def __init__(self):
+    # Dicts and lists whose repr is at least this long are dropped from "other" properties
+    SMALL_VALUE_SIZE = 100
+    
+    # Text style properties kept by _simplify_text_style, and their short names
+    _STYLE_MAP = (
+        ('fontSize', 'size'),
+        ('fontFamily', 'font'),
+        ('fontWeight', 'weight'),
+        ('textAlignHorizontal', 'align'),
+    )
+    
+    def __init__(self) -> None:
         # Essential properties to keep for layout understanding
-        self.essential_properties = {
+        self.essential_properties: FrozenSet[str] = frozenset({
             'id', 'name', 'type', 'visible',
             'children',  # For hierarchy
             'absoluteBoundingBox',  # For positioning
@@ -47,38 +193,37 @@ class FigmaDataFilter:
             # Component properties
             'componentPropertyDefinitions',  # Keep for component analysis
             'variantProperties',  # For variant components
-        }
+        })
         
         # Properties to completely remove (too verbose for LLM)
-        self.remove_properties = {
+        self.remove_properties: FrozenSet[str] = frozenset({
             'styles',  # Complex style references
             'effects',  # Shadows, blurs etc - very verbose
             'exportSettings',  # Multiple export configs
             'transitionNodeID', 'transitionDuration', 'transitionEasing',  # Prototyping
-            'overflowDirection',  # Rarely needed
-            'numberOfFixedChildren',  # Internal data
             'overlayPositionType', 'overlayBackgroundInteraction',  # Prototyping
             'preserveRatio',  # Image specific
             'reactions',  # Prototyping interactions
             'playbackSettings',  # Animation data
             'individualStrokeWeights',  # Detailed stroke data
             'strokeDashes',  # Vector details
+            'vectorPaths', 'vectorNetwork', 'fillGeometry', 'strokeGeometry',  # Vector path data
             'relativeTransform',  # Complex transform matrix
             'size',  # Redundant with absoluteBoundingBox
-            'counterAxisSizingMode', 'primaryAxisSizingMode',  # Complex layout
             'paddingLeft', 'paddingRight', 'paddingTop', 'paddingBottom',  # Use simplified
-            'gridStyleId', 'backgroundStyleId', 'fillStyleId', 'strokeStyleId',  # Style IDs
+            'backgroundStyleId', 'fillStyleId', 'strokeStyleId',  # Style IDs
             'textAutoResize',  # Text specific
             'layoutVersion',  # Internal versioning
-            'componentPropertyDefinitions',  # Complex component data
             'componentProperties',  # Component variants
             'overrides',  # Component overrides
             'prototypeDevice',  # Device preview settings
             'flowStartingPoints',  # Prototype flows
-        }
+        })
+        assert self.essential_properties.isdisjoint(self.remove_properties), \
+            "A property cannot be both essential and removed"
         
         # Properties to simplify
-        self.simplify_properties = {
+        self.simplify_properties: Dict[str, Callable[[Any], Any]] = {
             'fills': self._simplify_fills,
             'strokes': self._simplify_strokes,
             'constraints': self._simplify_constraints,
@@ -88,13 +233,33 @@ class FigmaDataFilter:
         }
         
         # Vector node types that often contain complex path data
-        self.vector_types = {
+        self.vector_types: FrozenSet[str] = frozenset({
             'VECTOR', 'LINE', 'REGULAR_POLYGON', 'ELLIPSE', 
             'STAR', 'BOOLEAN_OPERATION'
-        }
+        })
+        
+        # One action per known property name. Later updates win, so a name listed
+        # in several places resolves as remove > children > simplify > essential
+        self._dispatch: Dict[str, int] = dict.fromkeys(self.essential_properties, _KEEP)
+        self._dispatch.update(dict.fromkeys(self.simplify_properties, _SIMPLIFY))
+        self._dispatch['children'] = _CHILDREN
+        self._dispatch.update(dict.fromkeys(self.remove_properties, _REMOVE))
+        
+        # Semantic hints from name patterns, in priority order: each lookahead
+        # scans the whole name, and the first category found names the hint
+        self._hint_re = re.compile(
+            r'^(?:(?=.*?(?P<navigation>header|nav|toolbar))'
+            r'|(?=.*?(?P<interactive>button|btn|cta))'
+            r'|(?=.*?(?P<container>card|tile|panel))'
+            r'|(?=.*?(?P<form_element>input|field|form)))',
+            re.DOTALL
+        )
+        # Hint per node name; instances of a component share their name, so
+        # most nodes are answered from here
+        self._hint_cache: Dict[str, Optional[str]] = {}
         
         # Statistics tracking
-        self.stats = {
+        self.stats: Dict[str, int] = {
             'total_nodes': 0,
             'filtered_nodes': 0,
             'removed_properties': 0,
@@ -106,7 +271,10 @@ class FigmaDataFilter:
     
     def filter_figma_data(self, node: Dict[str, Any], max_depth: Optional[int] = None) -> Dict[str, Any]:
         """
-        Filter Figma node data recursively
+        Filter Figma node data and everything beneath it
+        
+        The tree is walked depth-first with an explicit stack rather than
+        Python recursion, so deeply nested files can't hit the recursion limit.
         
         Args:
             node: Figma node data
@@ -124,70 +292,150 @@ class FigmaDataFilter:
             print(f"Warning: Expected dict for node, got {type(node).__name__}")
             return {}
         
+        # An invisible node is dropped whole, the same as an invisible child
+        if not node.get('visible', True):
+            self.stats['original_size'] += _estimated_size(node)
+            return {}
+        
+        # Each frame is (node, max_depth, list to append the result to, finish).
+        # finish is None for a child still to visit; otherwise it holds the
+        # (filtered, original_size, filtered_size, children_queued) of a node
+        # whose children are all done
+        result: List[Dict[str, Any]] = []
+        stack: List[_Frame] = []
+        self._visit_node(node, max_depth, result, stack)
+        
+        while stack:
+            child, depth, siblings, finish = stack.pop()
+            
+            if finish is not None:
+                filtered = finish[0]
+                self._finish_node(child, *finish)
+                if filtered:  # Only add non-empty children
+                    siblings.append(filtered)
+                continue
+            
+            # Validate child is a dictionary
+            if not isinstance(child, dict):
+                print(f"Warning: Skipping non-dict child: {type(child).__name__}")
+                self.stats['original_size'] += _estimated_size(child)
+            # Skip invisible nodes
+            elif not child.get('visible', True):
+                self.stats['original_size'] += _estimated_size(child)
+            elif child:
+                self._visit_node(child, depth, siblings, stack)
+        
+        return result[0] if result else {}
+    
+    def _visit_node(self, node: Dict[str, Any], max_depth: Optional[int],
+                    siblings: List[Dict[str, Any]], stack: List[_Frame]) -> None:
+        """Filter a node's own properties and queue its children, then its finishing step"""
         # Track statistics
         self.stats['total_nodes'] += 1
         
         # Start with empty filtered node
-        filtered = {}
+        filtered: Dict[str, Any] = {}
+        children: Optional[List[Any]] = None
+        
+        dispatch_get = self._dispatch.get
+        
+        # Approximate compact JSON size of this node before and after filtering,
+        # counted property by property so no whole document has to be serialized.
+        # Kept values are measured in full; dropped ones are only estimated,
+        # so huge removed payloads stay cheap to skip.
+        # Children add their own when they are popped off the work stack
+        original_size = 2
+        filtered_size = 2
         
         # Process each property
         for key, value in node.items():
+            action = dispatch_get(key, _OTHER)
+            key_size = len(key) + 4
+            original_size += key_size
+            
             # Skip removed properties
-            if key in self.remove_properties:
+            if action == _REMOVE:
                 self.stats['removed_properties'] += 1
-                continue
+                original_size += _estimated_size(value)
+                new_value = _DROP
             
-            # Handle children recursively
-            if key == 'children' and value:
+            # Queue children; the filtered list keeps this key's position and is
+            # dropped when finishing the node if no child survives
+            elif action == _CHILDREN and value:
                 if max_depth is None or max_depth > 0:
-                    next_depth = None if max_depth is None else max_depth - 1
-                    filtered_children = []
-                    for child in value:
-                        # Validate child is a dictionary
-                        if not isinstance(child, dict):
-                            print(f"Warning: Skipping non-dict child: {type(child).__name__}")
-                            continue
-                        # Skip invisible nodes
-                        if child.get('visible', True):
-                            filtered_child = self.filter_figma_data(child, next_depth)
-                            if filtered_child:  # Only add non-empty children
-                                filtered_children.append(filtered_child)
-                    if filtered_children:
-                        filtered['children'] = filtered_children
+                    original_size += len(value) + 1
+                    children = value
+                    new_value = []
+                else:
+                    original_size += _estimated_size(value)
+                    new_value = _DROP
             
             # Simplify certain properties
-            elif key in self.simplify_properties:
-                simplified = self.simplify_properties[key](value)
-                if simplified is not None:
-                    filtered[key] = simplified
+            elif action == _SIMPLIFY:
+                original_size += _estimated_size(value)
+                new_value = self.simplify_properties[key](value)
+                if new_value is None:
+                    new_value = _DROP
+                else:
                     self.stats['simplified_properties'] += 1
+                    filtered_size += key_size + _json_size(new_value)
             
-            # Keep essential properties
-            elif key in self.essential_properties:
-                filtered[key] = value
+            # Keep essential properties (and empty children)
+            elif action == _KEEP or action == _CHILDREN:
+                value_size = _json_size(value)
+                original_size += value_size
+                filtered_size += key_size + value_size
+                new_value = value
             
             # For other properties, apply smart filtering
             else:
-                # Skip complex objects unless they're important
-                if isinstance(value, dict) and len(str(value)) > 200:
-                    continue
-                if isinstance(value, list) and len(str(value)) > 500:
-                    continue
-                # Keep simple values
+                # Keep simple values, and complex objects only when they're small
                 if isinstance(value, (str, int, float, bool)) or \
-                   (isinstance(value, (dict, list)) and len(str(value)) < 100):
-                    filtered[key] = value
+                   (isinstance(value, (dict, list)) and
+                        _approx_size(value, self.SMALL_VALUE_SIZE) < self.SMALL_VALUE_SIZE):
+                    value_size = _json_size(value)
+                    original_size += value_size
+                    filtered_size += key_size + value_size
+                    new_value = value
+                else:
+                    original_size += _estimated_size(value)
+                    new_value = _DROP
+            
+            if new_value is not _DROP:
+                filtered[key] = new_value
+        
+        stack.append((node, None, siblings,
+                      (filtered, original_size, filtered_size, children is not None)))
+        if children is not None:
+            next_depth = None if max_depth is None else max_depth - 1
+            filtered_children = filtered['children']
+            for child in reversed(children):
+                stack.append((child, next_depth, filtered_children, None))
+    
+    def _finish_node(self, node: Dict[str, Any], filtered: Dict[str, Any], original_size: int,
+                     filtered_size: int, children_queued: bool) -> None:
+        """Post-process a node once its children are filtered"""
+        if children_queued:
+            if filtered['children']:
+                filtered_size += len('children') + 5 + len(filtered['children'])
+            else:
+                del filtered['children']
         
-        # Special handling for vector nodes
+        # Mark vector nodes, whose path data was removed with remove_properties
         if node.get('type') in self.vector_types:
-            self._handle_vector_node(filtered)
+            filtered['_simplified'] = 'vector_paths_removed'
             self.stats['vector_nodes_simplified'] += 1
         
         # Add layout hints for better understanding
         self._add_layout_hints(filtered, node)
         
+        for key in _MARKER_KEYS:
+            if key in filtered:
+                filtered_size += len(key) + 4 + _json_size(filtered[key])
+        
+        self.stats['original_size'] += original_size
+        self.stats['filtered_size'] += filtered_size
         self.stats['filtered_nodes'] += 1
-        return filtered
     
     def _simplify_fills(self, fills: List[Dict[str, Any]]) -> Optional[str]:
         """Simplify fill information to just the primary color"""
@@ -196,14 +444,7 @@ class FigmaDataFilter:
         
         for fill in fills:
             if fill.get('visible', True) and fill.get('type') == 'SOLID':
-                color = fill.get('color', {})
-                opacity = fill.get('opacity', 1.0)
-                r = int(color.get('r', 0) * 255)
-                g = int(color.get('g', 0) * 255) 
-                b = int(color.get('b', 0) * 255)
-                if opacity < 1:
-                    return f"rgba({r},{g},{b},{opacity:.2f})"
-                return f"rgb({r},{g},{b})"
+                return _rgb(fill.get('color', {}), fill.get('opacity', 1.0))
         
         # For gradients, just indicate type
         gradient_types = [f.get('type') for f in fills if f.get('type') in ['GRADIENT_LINEAR', 'GRADIENT_RADIAL']]
@@ -219,12 +460,8 @@ class FigmaDataFilter:
         
         for stroke in strokes:
             if stroke.get('visible', True):
-                color = stroke.get('color', {})
-                r = int(color.get('r', 0) * 255)
-                g = int(color.get('g', 0) * 255)
-                b = int(color.get('b', 0) * 255)
                 return {
-                    'color': f"rgb({r},{g},{b})",
+                    'color': _rgb(stroke.get('color', {})),
                     'weight': stroke.get('weight', 1)
                 }
         return None
@@ -241,26 +478,15 @@ class FigmaDataFilter:
         if not style:
             return {}
         
-        simplified = {}
-        
         # Keep only essential text properties
-        if 'fontSize' in style:
-            simplified['size'] = style['fontSize']
-        if 'fontFamily' in style:
-            simplified['font'] = style['fontFamily']
-        if 'fontWeight' in style:
-            simplified['weight'] = style['fontWeight']
-        if 'textAlignHorizontal' in style:
-            simplified['align'] = style['textAlignHorizontal']
-        
-        return simplified
+        return {short: style[key] for key, short in self._STYLE_MAP if key in style}
     
     def _simplify_grids(self, grids: List[Dict[str, Any]]) -> Optional[str]:
         """Simplify grid information"""
         if not grids:
             return None
         
-        grid_types = []
+        grid_types: List[str] = []
         for grid in grids:
             if grid.get('visible', True):
                 pattern = grid.get('pattern', 'GRID')
@@ -274,31 +500,21 @@ class FigmaDataFilter:
             return blend_mode
         return None
     
-    def _handle_vector_node(self, filtered: Dict[str, Any]) -> None:
-        """Special handling for vector nodes to remove complex path data"""
-        # Remove vector-specific complex properties
-        vector_properties = ['vectorPaths', 'vectorNetwork', 'fillGeometry', 'strokeGeometry']
-        for prop in vector_properties:
-            if prop in filtered:
-                del filtered[prop]
-        
-        # Add simplified indicator
-        filtered['_simplified'] = 'vector_paths_removed'
-    
     def _add_layout_hints(self, filtered: Dict[str, Any], original: Dict[str, Any]) -> None:
         """Add helpful layout hints for LLM understanding"""
         node_type = original.get('type', '')
         
         # Add semantic hints based on name patterns
-        name = str(original.get('name') or '').lower()
-        if any(pattern in name for pattern in ['header', 'nav', 'toolbar']):
-            filtered['_hint'] = 'navigation'
-        elif any(pattern in name for pattern in ['button', 'btn', 'cta']):
-            filtered['_hint'] = 'interactive'
-        elif any(pattern in name for pattern in ['card', 'tile', 'panel']):
-            filtered['_hint'] = 'container'
-        elif any(pattern in name for pattern in ['input', 'field', 'form']):
-            filtered['_hint'] = 'form_element'
+        name = original.get('name')
+        if name and isinstance(name, str):
+            try:
+                hint = self._hint_cache[name]
+            except KeyError:
+                hint_match = self._hint_re.match(name.lower())
+                hint = hint_match.lastgroup if hint_match else None
+                self._hint_cache[name] = hint
+            if hint:
+                filtered['_hint'] = hint
         
         # Add layout pattern hints
         if original.get('layoutMode') == 'HORIZONTAL':
@@ -317,23 +533,22 @@ class FigmaDataFilter:
         if len(children) < 4:
             return False
         
-        # Get positions
-        positions = []
+        # Grid-like once at least 4 positioned children span multiple rows and
+        # columns; stop scanning as soon as that's known
+        positioned = 0
+        x_positions: Set[Any] = set()
+        y_positions: Set[Any] = set()
         for child in children:
             # Ensure child is a dictionary before checking properties
             if isinstance(child, dict) and 'absoluteBoundingBox' in child:
                 bounds = child['absoluteBoundingBox']
-                positions.append((bounds.get('x', 0), bounds.get('y', 0)))
+                positioned += 1
+                x_positions.add(bounds.get('x', 0))
+                y_positions.add(bounds.get('y', 0))
+                if positioned >= 4 and len(x_positions) >= 2 and len(y_positions) >= 2:
+                    return True
         
-        if len(positions) < 4:
-            return False
-        
-        # Check for regular spacing patterns
-        x_positions = sorted(set(x for x, _ in positions))
-        y_positions = sorted(set(y for _, y in positions))
-        
-        # Grid-like if we have multiple rows and columns
-        return len(x_positions) >= 2 and len(y_positions) >= 2
+        return False
     
     def get_statistics(self) -> Dict[str, Any]:
         """Get filtering statistics"""
@@ -347,15 +562,25 @@ class FigmaDataFilter:
             'reduction_percentage': round(reduction, 2)
         }
     
-    def estimate_token_reduction(self, original_json: str, filtered_json: str) -> Dict[str, int]:
-        """Estimate token reduction for LLM processing"""
+    def estimate_token_reduction(self, original_json: Optional[str] = None,
+                                 filtered_json: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Estimate token reduction for LLM processing
+        
+        Uses the sizes counted while filtering, so nothing has to be serialized
+        (the size of dropped data is estimated from its shape); already
+        serialized JSON strings can still be passed in instead.
+        """
+        original_chars = len(original_json) if original_json is not None else self.stats['original_size']
+        filtered_chars = len(filtered_json) if filtered_json is not None else self.stats['filtered_size']
+        
         # Rough estimation: 1 token ≈ 4 characters
-        original_tokens = len(original_json) // 4
-        filtered_tokens = len(filtered_json) // 4
+        original_tokens = original_chars // 4
+        filtered_tokens = filtered_chars // 4
         
         return {
             'original_tokens': original_tokens,
             'filtered_tokens': filtered_tokens,
             'tokens_saved': original_tokens - filtered_tokens,
-            'reduction_percentage': round((1 - filtered_tokens / original_tokens) * 100, 2)
-        } 
\ No newline at end of file
+            'reduction_percentage': round((1 - filtered_tokens / original_tokens) * 100, 2) if original_tokens else 0
+        }
@@ -4,40 +4,137 @@ Reconstructs structured layout from Figma's coordinate-based nodes
 Implements intelligent row grouping and layout inference
 """
 
-from typing import Dict, Any, List, Optional
+from itertools import repeat
+from operator import itemgetter
+from typing import Dict, Any, List, Optional, Tuple
 
 # A small tolerance to group elements into the same row.
 Y_TOLERANCE = 5
 
+# A child waiting to be processed: (figma_node, parent's children list, slot index)
+_PendingChild = Tuple[Dict[str, Any], List[Any], int]
+
+# A child read for row grouping: (figma_node, x, y). Coordinates come straight
+# from the Figma JSON, so they're left as Any rather than forced to float.
+_Entry = Tuple[Dict[str, Any], Any, Any]
+
+# Accessors for the (child, x, y) entries used in row grouping. itemgetter keeps
+# sorting and pulling out the y column free of Python-level callbacks, and unlike
+# sorting the tuples directly it never falls through to comparing child dicts on a tie.
+_BY_Y_THEN_X = itemgetter(2, 1)
+_BY_X = itemgetter(1)
+_Y_OF = itemgetter(2)
+
+# Layout types whose children are always worth summarizing
+_MEANINGFUL_LAYOUTS = frozenset({'VERTICAL', 'HORIZONTAL', 'ROW_GROUP', 'GRID'})
+
+
+def _position(node: Dict[str, Any]) -> Tuple[Any, Any]:
+    """
+    Returns the (x, y) of a Figma node's absoluteBoundingBox, used for accurate
+    positioning. A missing box or coordinate counts as 0.
+    """
+    bounds = node.get('absoluteBoundingBox')
+    if not bounds:
+        return 0, 0
+    return bounds.get('x', 0), bounds.get('y', 0)
+
+
+def _row_breaks(ys: List[Any], tolerance: float = Y_TOLERANCE) -> List[int]:
+    """
+    Returns the indices into the sorted ys at which a new row starts.
+
+    A row is anchored on its first node's y, so a run of small steps can't
+    stretch one row past the tolerance.
+    """
+    breaks: List[int] = []
+    if not ys:
+        return breaks
+    row_y = ys[0]
+    for i in range(1, len(ys)):
+        y = ys[i]
+        if abs(y - row_y) > tolerance:
+            breaks.append(i)
+            row_y = y
+    return breaks
+
+
+def _sort_row_by_x(row: List[_Entry]) -> List[_Entry]:
+    """
+    Puts a row of (child, x, y) entries, already sorted by (y, x), into x order.
+
+    When every entry shares the same y the (y, x) order is already the x
+    order, so only rows spanning several y values within the tolerance
+    actually get re-sorted.
+    """
+    if row[0][2] != row[-1][2]:
+        row.sort(key=_BY_X)
+    return row
+
+
 class LayoutNode:
     """Our custom, simplified node for the reconstructed layout tree."""
-    def __init__(self, figma_node: Dict[str, Any]):
+    # Layout trees can hold tens of thousands of nodes, so skip the per-instance __dict__
+    __slots__ = ('id', 'name', 'type', 'layout_type', 'children', 'original_node', '_metadata')
+
+    def __init__(self, figma_node: Any):
         # Validate input type
         if not isinstance(figma_node, dict):
             # Create a minimal valid node if input is invalid
             print(f"Warning: LayoutNode received non-dict input: {type(figma_node).__name__}")
             figma_node = {"id": "invalid", "name": "Invalid Node", "type": "ERROR"}
         
-        self.id: str = figma_node.get('id')
-        self.name: str = figma_node.get('name')
-        self.type: str = figma_node.get('type')
+        self.id: Optional[str] = figma_node.get('id')
+        self.name: Optional[str] = figma_node.get('name')
+        self.type: Optional[str] = figma_node.get('type')
         # The computed layout: 'ABSOLUTE', 'HORIZONTAL', 'VERTICAL', 'ROW_GROUP', 'GRID'
         self.layout_type: str = 'ABSOLUTE' 
         self.children: List['LayoutNode'] = []
         # A reference to the original Figma node for later analysis (e.g., styles)
         self.original_node: Dict[str, Any] = figma_node
-        # Metadata for storing additional inferred properties
-        self.metadata: Dict[str, Any] = {}
+        # Metadata for storing additional inferred properties. Most nodes never
+        # get any, so the dict is only created on first access to metadata.
+        self._metadata: Optional[Dict[str, Any]] = None
+
+    @property
+    def metadata(self) -> Dict[str, Any]:
+        """Additional inferred properties, created empty on first access"""
+        if self._metadata is None:
+            self._metadata = {}
+        return self._metadata
+
+    @metadata.setter
+    def metadata(self, value: Dict[str, Any]) -> None:
+        self._metadata = value
+
+    @property
+    def has_metadata(self) -> bool:
+        """Whether any metadata has been set, without creating the dict"""
+        return bool(self._metadata)
 
     def to_dict(self) -> Dict[str, Any]:
         """Converts the LayoutNode and its children to a dictionary for serialization."""
+        result = self._node_dict()
+        # Fill in each node's children list from an explicit stack instead of recursing
+        stack = [(self, result["children"])]
+        while stack:
+            node, out = stack.pop()
+            for child in node.children:
+                child_dict = child._node_dict()
+                out.append(child_dict)
+                if child.children:
+                    stack.append((child, child_dict["children"]))
+        return result
+
+    def _node_dict(self) -> Dict[str, Any]:
+        """This node's fields as a dict, with an empty children list to fill in."""
         return {
             "id": self.id,
             "name": self.name,
             "type": self.type,
             "layout_type": self.layout_type,
-            "metadata": self.metadata,
-            "children": [child.to_dict() for child in self.children]
+            "metadata": self._metadata if self._metadata is not None else {},
+            "children": []
         }
 
 class LayoutReconstructor:
@@ -53,7 +150,7 @@ class LayoutReconstructor:
             'skipped_nodes': 0
         }
     
-    def reconstruct_layout(self, root_figma_node: Dict[str, Any]) -> Optional[LayoutNode]:
+    def reconstruct_layout(self, root_figma_node: Optional[Dict[str, Any]]) -> Optional[LayoutNode]:
         """
         Main entry point for the reconstruction process.
         
@@ -69,14 +166,54 @@ class LayoutReconstructor:
 
     def _process_node(self, figma_node: Dict[str, Any]) -> LayoutNode:
         """
-        Recursively processes a Figma node and its children to build the layout tree.
+        Processes a Figma node and its children to build the layout tree.
+
+        Nodes are visited depth-first from an explicit stack rather than by
+        recursion, so deeply nested Figma files can't hit the recursion limit.
+        Each parent reserves a slot for every child, which is filled in once
+        that child is popped and built.
+        """
+        root_slot: List[Any] = [None]
+        stack: List[_PendingChild] = [(figma_node, root_slot, 0)]
+        while stack:
+            node, siblings, slot = stack.pop()
+            layout_node, pending = self._build_node(node)
+            siblings[slot] = layout_node
+            # Push in reverse so children are built in their final order
+            stack.extend(reversed(pending))
+        return root_slot[0]
+
+    @staticmethod
+    def _queue_children(
+        figma_children: List[Dict[str, Any]],
+        target: List[Any],
+        pending: List[_PendingChild]
+    ) -> None:
+        """Reserve a slot in target for each child and queue it for building."""
+        start = len(target)
+        target.extend([None] * len(figma_children))
+        for offset, child in enumerate(figma_children):
+            pending.append((child, target, start + offset))
+
+    def _build_node(self, figma_node: Dict[str, Any]) -> Tuple[LayoutNode, List[_PendingChild]]:
+        """
+        Builds the LayoutNode for a single Figma node and works out where each
+        of its children goes, without processing the children themselves.
         """
         self.stats['total_nodes'] += 1
         layout_node = LayoutNode(figma_node)
+        pending: List[_PendingChild] = []
 
         children = figma_node.get('children')
         if not children:
-            return layout_node
+            return layout_node, pending
+
+        # Filter out non-dict children. Well-formed Figma responses only have
+        # dicts, so the list is only copied when there's something to drop.
+        if all(map(isinstance, children, repeat(dict))):
+            valid_children = children
+        else:
+            valid_children = [child for child in children if isinstance(child, dict)]
 
         # --- Step 1: Prioritize Figma's Auto Layout ---
         layout_mode = figma_node.get('layoutMode')
@@ -84,22 +221,21 @@ class LayoutReconstructor:
             self.stats['auto_layout_nodes'] += 1
             layout_node.layout_type = layout_mode
             # With Auto Layout, the order is already correct. Just process the children.
-            # Filter out non-dict children
-            valid_children = [child for child in children if isinstance(child, dict)]
             if len(valid_children) < len(children):
                 print(f"Warning: Skipped {len(children) - len(valid_children)} non-dict children in {figma_node.get('name', 'Unknown')}")
-            layout_node.children = [self._process_node(child) for child in valid_children]
-            
-            # Store all auto-layout metadata
-            layout_node.metadata['item_spacing'] = figma_node.get('itemSpacing', 0)
-            layout_node.metadata['auto_layout'] = True
+            self._queue_children(valid_children, layout_node.children, pending)
             
-            # NEW: Store additional auto-layout properties
-            layout_node.metadata['primary_axis_align'] = figma_node.get('primaryAxisAlignItems')
-            layout_node.metadata['counter_axis_align'] = figma_node.get('counterAxisAlignItems')
-            layout_node.metadata['primary_axis_sizing'] = figma_node.get('primaryAxisSizingMode')
-            layout_node.metadata['counter_axis_sizing'] = figma_node.get('counterAxisSizingMode')
-            layout_node.metadata['layout_wrap'] = figma_node.get('layoutWrap')
+            # Store all auto-layout metadata, built in one go rather than key by key
+            layout_node.metadata = {
+                'item_spacing': figma_node.get('itemSpacing', 0),
+                'auto_layout': True,
+                # NEW: Store additional auto-layout properties
+                'primary_axis_align': figma_node.get('primaryAxisAlignItems'),
+                'counter_axis_align': figma_node.get('counterAxisAlignItems'),
+                'primary_axis_sizing': figma_node.get('primaryAxisSizingMode'),
+                'counter_axis_sizing': figma_node.get('counterAxisSizingMode'),
+                'layout_wrap': figma_node.get('layoutWrap'),
+            }
             
             # NEW: Special handling for GRID layout
             if layout_mode == 'GRID':
@@ -112,7 +248,7 @@ class LayoutReconstructor:
                     columns = self._infer_grid_columns(valid_children)
                     layout_node.metadata['columns'] = columns
             
-            return layout_node
+            return layout_node, pending
 
         # --- Step 2: Check for inferred auto-layout ---
         inferred = figma_node.get('inferredAutoLayout')
@@ -120,69 +256,45 @@ class LayoutReconstructor:
             # Figma has detected this could be auto-layout
             self.stats['inferred_layout_nodes'] += 1
             layout_node.layout_type = inferred.get('layoutMode', 'ABSOLUTE')
-            layout_node.metadata['inferred'] = True
-            layout_node.metadata['item_spacing'] = inferred.get('itemSpacing', 0)
+            layout_node.metadata = {'inferred': True, 'item_spacing': inferred.get('itemSpacing', 0)}
             
             # Process children with inferred layout
-            valid_children = [child for child in children if isinstance(child, dict)]
-            layout_node.children = [self._process_node(child) for child in valid_children]
-            return layout_node
+            self._queue_children(valid_children, layout_node.children, pending)
+            return layout_node, pending
 
         # --- Step 3: Heuristic Inference for non-Auto Layout Frames ---
         
-        # Filter out non-dict children before processing
-        valid_children = [child for child in children if isinstance(child, dict)]
+        # Report non-dict children before processing
         if len(valid_children) < len(children):
             print(f"Warning: Skipped {len(children) - len(valid_children)} non-dict children in {figma_node.get('name', 'Unknown')}")
         
-        # Sort nodes top-to-bottom, then left-to-right.
-        def sort_key(node):
-            # Use absoluteBoundingBox for accurate positioning
-            bounds = node.get('absoluteBoundingBox', {'x': 0, 'y': 0})
-            return (bounds.get('y', 0), bounds.get('x', 0))
-        
+        # Read each child's bounding box once into (child, x, y) entries;
+        # sorting, row grouping and the per-row x order all work off these.
+        entries = [(child, *_position(child)) for child in valid_children]
 
+        if not entries:
+            return layout_node, pending
 
-        sorted_children = sorted(valid_children, key=sort_key)
-
-        if not sorted_children:
-            return layout_node
+        # Sort nodes top-to-bottom, then left-to-right.
+        entries.sort(key=_BY_Y_THEN_X)
 
         # --- Step 3: Group Sorted Nodes into Rows ---
-        rows: List[List[Dict[str, Any]]] = []
-        if sorted_children:
-            current_row = [sorted_children[0]]
-            last_node_y = sort_key(sorted_children[0])[0]
-
-            for i in range(1, len(sorted_children)):
-                current_node = sorted_children[i]
-                current_node_y = sort_key(current_node)[0]
-
-                # If the current node is vertically aligned with the last node, add it to the current row.
-                if abs(current_node_y - last_node_y) <= Y_TOLERANCE:
-                    current_row.append(current_node)
-                else:
-                    # Otherwise, the row is finished. Push it and start a new one.
-                    rows.append(current_row)
-                    current_row = [current_node]
-                    last_node_y = current_node_y
-            rows.append(current_row) # Add the last row
+        row_starts = [0, *_row_breaks(list(map(_Y_OF, entries))), len(entries)]
+        rows = [entries[start:end] for start, end in zip(row_starts, row_starts[1:])]
 
         # --- Step 4: Build the final layout tree for this node ---
         if len(rows) > 1:
             # If we have multiple rows, treat this node as a vertical container of rows.
             layout_node.layout_type = 'VERTICAL'
-            layout_node.metadata['has_row_groups'] = True
-            layout_node.metadata['inferred'] = True
-            layout_node.metadata['row_count'] = len(rows)
+            layout_node.metadata = {'has_row_groups': True, 'inferred': True, 'row_count': len(rows)}
             
-            for index, row_nodes in enumerate(rows):
+            for index, row_entries in enumerate(rows):
                 # Sort each row by X to ensure correct horizontal order
-                sorted_row_nodes = sorted(row_nodes, key=lambda n: n.get('absoluteBoundingBox', {'x': 0}).get('x', 0))
+                _sort_row_by_x(row_entries)
 
-                if len(sorted_row_nodes) == 1:
+                if len(row_entries) == 1:
                     # Single item in row, add directly
-                    layout_node.children.append(self._process_node(sorted_row_nodes[0]))
+                    self._queue_children([row_entries[0][0]], layout_node.children, pending)
                 else:
                     # Multiple items, create a synthetic row group
                     row_group_node = LayoutNode({
@@ -191,19 +303,18 @@ class LayoutReconstructor:
                         'type': 'GROUP' # Use a generic type for the synthetic node
                     })
                     row_group_node.layout_type = 'ROW_GROUP' # Our custom type for an inferred row
-                    row_group_node.metadata['inferred'] = True
-                    row_group_node.metadata['item_count'] = len(sorted_row_nodes)
-                    row_group_node.children = [self._process_node(node) for node in sorted_row_nodes]
+                    row_group_node.metadata = {'inferred': True, 'item_count': len(row_entries)}
+                    self._queue_children([entry[0] for entry in row_entries], row_group_node.children, pending)
                     layout_node.children.append(row_group_node)
 
         elif len(rows) == 1:
             # If there's only one row, treat this node as a horizontal container.
             layout_node.layout_type = 'HORIZONTAL'
-            layout_node.metadata['inferred'] = True
-            sorted_row_nodes = sorted(rows[0], key=lambda n: n.get('absoluteBoundingBox', {'x': 0}).get('x', 0))
-            layout_node.children = [self._process_node(node) for node in sorted_row_nodes]
+            layout_node.metadata = {'inferred': True}
+            row_entries = _sort_row_by_x(rows[0])
+            self._queue_children([entry[0] for entry in row_entries], layout_node.children, pending)
 
-        return layout_node
+        return layout_node, pending
     
     def get_statistics(self) -> Dict[str, Any]:
         """Get processing statistics"""
@@ -224,14 +335,14 @@ class LayoutReconstructor:
         if not children:
             return 1
         
-        # Get unique X positions
-        x_positions = set()
-        for child in children:
-            bounds = child.get('absoluteBoundingBox', {})
-            if bounds:
-                x_positions.add(round(bounds.get('x', 0)))
+        # Get unique X positions of the children that have a bounding box
+        x_positions = {
+            round(bounds.get('x', 0))
+            for bounds in (child.get('absoluteBoundingBox') for child in children)
+            if bounds
+        }
         
-        return len(x_positions) if x_positions else 1
+        return len(x_positions) or 1
 
 
 def create_llm_summary(
@@ -242,10 +353,14 @@ def create_llm_summary(
     skip_pure_containers: bool = True
 ) -> Optional[Dict[str, Any]]:
     """
-    Recursively traverses the layout tree and creates a concise summary
+    Traverses the layout tree and creates a concise summary
     for an LLM, enriching nodes with detected component information. This is the
     function that solves the "too much data" problem.
 
+    The tree is walked from an explicit stack: a container's summary is only
+    kept once all of its children have been summarized, so pruned subtrees
+    never need a recursive call of their own.
+
     Args:
         layout_node: The current node in the layout tree.
         component_map: A dictionary mapping node IDs to detected component info.
@@ -256,65 +371,85 @@ def create_llm_summary(
     Returns:
         A simplified dictionary representing the subtree, ready for an LLM.
     """
-    # Stop at max depth
-    if current_depth >= max_depth:
-        return None
-    
-    detected_component = component_map.get(layout_node.id)
-    
-    # Skip pure layout nodes that have no meaningful children
-    if skip_pure_containers and not detected_component and layout_node.type in ['VECTOR', 'GROUP']:
-        # Check if any child has a component
-        has_component_child = any(
-            component_map.get(child.id) for child in layout_node.children
-        )
-        if not has_component_child and len(layout_node.children) > 5:
-            # Too many non-component children, skip
-            return None
-
-    summary = {
-        "name": layout_node.name,
-        "layout": layout_node.layout_type
-    }
+    component_lookup = component_map.get
+    # A live view of the mapped ids: its isdisjoint() checks a whole child list
+    # against the map in one call, without copying the map into a set
+    component_ids = component_map.keys()
+    results: List[Dict[str, Any]] = []
+    # Entries are either (False, node, depth, out) to summarize a node into out,
+    # or (True, summary, child_summaries, out, detected_component) to finish a
+    # container once every one of its children has been summarized.
+    stack: List[Tuple[Any, ...]] = [(False, layout_node, current_depth, results)]
+
+    while stack:
+        entry = stack.pop()
+        if entry[0]:
+            _, summary, child_summaries, out, detected_component = entry
+            # Only add children if we have some
+            if child_summaries:
+                summary["children"] = child_summaries
+                out.append(summary)
+            elif detected_component:
+                # Component with no visible children, still include it
+                out.append(summary)
+            # Otherwise it's a container with no meaningful children, skip it
+            continue
+
+        _, node, depth, out = entry
+        # Stop at max depth
+        if depth >= max_depth:
+            continue
+
+        children_nodes = node.children
+        detected_component = component_lookup(node.id)
+
+        # Skip pure layout nodes that have too many children and no components among them
+        if (
+            skip_pure_containers and
+            not detected_component and
+            node.type in ('VECTOR', 'GROUP') and
+            len(children_nodes) > 5
+        ):
+            child_ids = [child.id for child in children_nodes]
+            # Only a child mapped to a non-empty component counts
+            if component_ids.isdisjoint(child_ids) or not any(map(component_lookup, child_ids)):
+                continue
+
+        summary = {
+            "name": node.name,
+            "layout": node.layout_type
+        }
 
-    if detected_component:
-        summary["component"] = detected_component.get("component_type", "custom")
-        # Add any other important component properties here
-        if detected_component.get("properties"):
-            summary["properties"] = detected_component.get("properties")
-    else:
-        # It's a container or a non-component element
-        summary["component"] = "container" if layout_node.children else "element"
-
-    # Only include children for meaningful containers
-    if layout_node.children and (
-        layout_node.layout_type in ['VERTICAL', 'HORIZONTAL', 'ROW_GROUP', 'GRID'] or
-        detected_component or
-        current_depth < 3  # Always show first 3 levels
-    ):
-        children = []
-        for child in layout_node.children:
-            child_summary = create_llm_summary(
-                child, 
-                component_map, 
-                max_depth, 
-                current_depth + 1,
-                skip_pure_containers
-            )
-            if child_summary:
-                children.append(child_summary)
-        
-        # Only add children if we have some
-        if children:
-            summary["children"] = children
-        elif detected_component:
-            # Component with no visible children, still include it
-            pass
+        if detected_component:
+            summary["component"] = detected_component.get("component_type", "custom")
+            # Add any other important component properties here
+            properties = detected_component.get("properties")
+            if properties:
+                summary["properties"] = properties
         else:
-            # Container with no meaningful children, skip it
-            return None
+            # It's a container or a non-component element
+            summary["component"] = "container" if children_nodes else "element"
+
+        # Only include children for meaningful containers
+        if children_nodes and (
+            node.layout_type in _MEANINGFUL_LAYOUTS or
+            detected_component or
+            depth < 3  # Always show first 3 levels
+        ):
+            child_summaries: List[Dict[str, Any]] = []
+            stack.append((True, summary, child_summaries, out, detected_component))
+            # Children at max_depth would all be cut off, so don't visit them
+            if depth + 1 < max_depth:
+                child_depth = depth + 1
+                # Push in reverse so summaries are appended in document order
+                stack.extend([
+                    (False, child, child_depth, child_summaries)
+                    for child in reversed(children_nodes)
+                ])
+        else:
+            out.append(summary)
 
-    return summary
+    return results[0] if results else None
 
 
 def create_compact_llm_summary(
@@ -325,54 +460,53 @@ def create_compact_llm_summary(
     Creates an ultra-compact summary focusing only on components and their layout relationships.
     Perfect for LLM context windows.
     """
-    def extract_components(node: LayoutNode, depth: int = 0) -> List[Dict[str, Any]]:
-        """Extract only nodes with detected components"""
-        results = []
-        
-        detected = component_map.get(node.id)
+    component_lookup = component_map.get
+    # Components grouped by depth for better understanding
+    hierarchy: Dict[int, List[Dict[str, Any]]] = {}
+    total_components = 0
+    has_row_groups = has_grid = uses_auto_layout = False
+
+    # One pre-order walk collects the components and all three layout patterns
+    stack = [(layout_node, 0)]
+    while stack:
+        node, depth = stack.pop()
+
+        detected = component_lookup(node.id)
         if detected:
             item = {
                 "name": node.name,
                 "component": detected.get("component_type"),
-                "layout_context": node.layout_type,
-                "depth": depth
+                "layout_context": node.layout_type
             }
-            if detected.get("properties"):
-                item["properties"] = detected.get("properties")
-            results.append(item)
-        
-        # Recurse for children
-        for child in node.children:
-            results.extend(extract_components(child, depth + 1))
-        
-        return results
-    
-    # Build component hierarchy
-    components = extract_components(layout_node)
-    
-    # Group by depth for better understanding
-    hierarchy = {}
-    for comp in components:
-        depth = comp.pop("depth")
-        if depth not in hierarchy:
-            hierarchy[depth] = []
-        hierarchy[depth].append(comp)
+            properties = detected.get("properties")
+            if properties:
+                item["properties"] = properties
+            level = hierarchy.get(depth)
+            if level is None:
+                level = hierarchy[depth] = []
+            level.append(item)
+            total_components += 1
+
+        layout_type = node.layout_type
+        if layout_type == "ROW_GROUP":
+            has_row_groups = True
+        elif layout_type == "GRID":
+            has_grid = True
+        if not uses_auto_layout and node.has_metadata and node.metadata.get("auto_layout"):
+            uses_auto_layout = True
+
+        # Push children in reverse so they're visited in document order
+        if node.children:
+            child_depth = depth + 1
+            stack.extend([(child, child_depth) for child in reversed(node.children)])
     
     return {
         "page_layout": layout_node.layout_type,
-        "total_components": len(components),
+        "total_components": total_components,
         "component_hierarchy": hierarchy,
         "layout_patterns": {
-            "has_row_groups": any(n.layout_type == "ROW_GROUP" for n in _get_all_nodes(layout_node)),
-            "has_grid": any(n.layout_type == "GRID" for n in _get_all_nodes(layout_node)),
-            "uses_auto_layout": any(n.metadata.get("auto_layout") for n in _get_all_nodes(layout_node))
+            "has_row_groups": has_row_groups,
+            "has_grid": has_grid,
+            "uses_auto_layout": uses_auto_layout
         }
     }
-
-
-def _get_all_nodes(node: LayoutNode) -> List[LayoutNode]:
-    """Helper to get all nodes in tree"""
-    nodes = [node]
-    for child in node.children:
-        nodes.extend(_get_all_nodes(child))
-    return nodes 
\ No newline at end of file
@@ -4,13 +4,69 @@ Maps reconstructed layout nodes to appropriate Modus components
 Uses naming conventions, structural analysis, and style heuristics
 """
 
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Callable, Dict, FrozenSet, Iterator, List, Any, Optional, Tuple
+import functools
 import re
 from dataclasses import dataclass, field
 from layout_reconstruction import LayoutNode
 
+# Keywords in an INSTANCE's "type" variant property, checked in order
+_VARIANT_TYPE_KEYWORDS: Tuple[Tuple[str, str], ...] = (
+    ('button', 'modus-wc-button'),
+    ('input', 'modus-wc-text-input'),
+    ('nav', 'modus-wc-navbar'),
+)
 
-@dataclass
+# A Modus tag such as "modus-wc-button" inside a layer name
+_MODUS_TAG_RE = re.compile(r'modus-wc-[\w-]+')
+
+
+def _fuse_patterns(patterns: List[str]) -> 're.Pattern[str]':
+    """
+    Combine regexes into one case-insensitive alternation, with pattern i in
+    a group named m{i}. When every pattern starts with a word boundary, that
+    check is hoisted in front of the alternation so positions inside a word
+    are skipped before any pattern is tried.
+    """
+    word_anchored = all(pattern.startswith(r'\b') for pattern in patterns)
+    skip = len(r'\b') if word_anchored else 0
+    alternation = '|'.join(
+        f'(?P<m{index}>{pattern[skip:]})' for index, pattern in enumerate(patterns)
+    )
+    return re.compile((r'\b(?:' if word_anchored else '(?:') + alternation + ')', re.IGNORECASE)
+
+
+
+def _required_keywords(patterns: List[str]) -> List[str]:
+    """
+    Literal words at least one of which occurs in anything the patterns match.
+    
+    Each pattern must open (after an optional \\b) with a group of
+    alternatives; the letters each alternative starts with are collected,
+    and words containing a shorter collected word are dropped. Raises
+    ValueError for a pattern no word can be read from, so a new pattern
+    can't silently escape the keyword prefilter.
+    """
+    words = set()
+    for pattern in patterns:
+        body = pattern[len(r'\b'):] if pattern.startswith(r'\b') else pattern
+        group = re.match(r'\(([^()]*)\)', body)
+        if not group:
+            raise ValueError(f"can't derive a keyword from name pattern {pattern!r}")
+        for alternative in group.group(1).split('|'):
+            word = re.match(r'[a-z]*', alternative).group(0)
+            # A quantifier after the last letter makes that letter optional
+            if alternative[len(word):len(word) + 1] in ('?', '*', '{'):
+                word = word[:-1]
+            if not word:
+                raise ValueError(f"can't derive a keyword from name pattern {pattern!r}")
+            words.add(word)
+    return sorted(word for word in words
+                  if not any(other != word and other in word for other in words))
+
+
+# One ModusComponent is created per mapped node, so drop the per-instance __dict__
+@dataclass(slots=True)
 class ModusComponent:
     """Represents a mapped Modus component"""
     component_type: str  # e.g., 'modus-wc-button'
@@ -23,6 +79,20 @@ class ModusComponent:
     children: List['ModusComponent'] = field(default_factory=list)
     
     def to_dict(self) -> Dict[str, Any]:
+        result = self._component_dict()
+        # Fill in each component's children list from an explicit stack instead of recursing
+        stack = [(self, result['children'])]
+        while stack:
+            component, out = stack.pop()
+            for child in component.children:
+                child_dict = child._component_dict()
+                out.append(child_dict)
+                if child.children:
+                    stack.append((child, child_dict['children']))
+        return result
+    
+    def _component_dict(self) -> Dict[str, Any]:
+        """This component's fields as a dict, with an empty children list"""
         return {
             'component_type': self.component_type,
             'original_node_id': self.original_node_id,
@@ -31,57 +101,83 @@ class ModusComponent:
             'confidence': self.confidence,
             'detection_method': self.detection_method,
             'layout_css': self.layout_css,
-            'children': [child.to_dict() for child in self.children]
+            'children': []
         }
 
 
 class ModusComponentMapper:
     """Maps layout nodes to Modus components"""
     
+    # Component name mappings (order matters - more specific patterns first)
+    NAME_MAPPINGS = {
+        # Buttons
+        r'\b(button|btn|cta)\b': 'modus-wc-button',
+        
+        # Form inputs
+        r'\b(input|text\s?field|textfield)\b': 'modus-wc-text-input',
+        r'\b(text\s?area|textarea)\b': 'modus-wc-textarea',
+        r'\b(number|numeric)\s?(input|field)?\b': 'modus-wc-number-input',
+        r'\b(select|dropdown)\b': 'modus-wc-select',
+        r'\b(checkbox|check)\b': 'modus-wc-checkbox',
+        r'\b(radio|radio\s?button)\b': 'modus-wc-radio',
+        r'\b(switch|toggle)\b': 'modus-wc-switch',
+        r'\b(slider|range)\b': 'modus-wc-slider',
+        r'\b(date|calendar|date\s?picker)\b': 'modus-wc-date',
+        r'\b(time|time\s?picker)\b': 'modus-wc-time-input',
+        r'\b(search|autocomplete|typeahead)\b': 'modus-wc-autocomplete',
+        
+        # Navigation (check sidebar patterns first - they're more specific)
+        r'\b(side\s*navigation|side-navigation|sidebar|side\s*nav|sidenav|aside)\b': 'modus-wc-side-navigation',
+        r'\b(navbar|nav\s*bar|header|top\s*bar|navigation\s*bar)\b': 'modus-wc-navbar',
+        r'\b(breadcrumb|breadcrumbs)\b': 'modus-wc-breadcrumbs',
+        r'\b(tab|tabs)\b': 'modus-wc-tabs',
+        r'\b(pagination|pager)\b': 'modus-wc-pagination',
+        
+        # Display components
+        r'\b(card|tile|panel)\b': 'modus-wc-card',
+        r'\b(table|grid)\b': 'modus-wc-table',
+        r'\b(alert|notification|message)\b': 'modus-wc-alert',
+        r'\b(modal|dialog|popup)\b': 'modus-wc-modal',
+        r'\b(tooltip|hint|popover)\b': 'modus-wc-tooltip',
+        r'\b(badge)\b': 'modus-wc-badge',
+        r'\b(chip|tag|pill)\b': 'modus-wc-chip',
+        r'\b(progress|progress\s?bar)\b': 'modus-wc-progress',
+        r'\b(loader|spinner|loading)\b': 'modus-wc-loader',
+        r'\b(skeleton)\b': 'modus-wc-skeleton',
+        
+        # Other
+        r'\b(avatar|profile\s?pic)\b': 'modus-wc-avatar',
+        r'\b(icon)\b': 'modus-wc-icon',
+        r'\b(divider|separator)\b': 'modus-wc-divider',
+    }
+    
+    # NAME_MAPPINGS compiled once when the class is created, in the same order
+    _COMPILED_NAME_MAPPINGS: List[Tuple['re.Pattern[str]', str]] = [
+        (re.compile(pattern, re.IGNORECASE), component_type)
+        for pattern, component_type in NAME_MAPPINGS.items()
+    ]
+    # The same patterns fused into one alternation, so a single search tells
+    # whether any pattern occurs in the name at all, and which one matched there
+    _NAME_MAPPINGS_RE = _fuse_patterns(list(NAME_MAPPINGS))
+    _NAME_MAPPING_INDEX = {f'm{index}': index for index in range(len(NAME_MAPPINGS))}
+    # Literal keywords, at least one of which every NAME_MAPPINGS match contains
+    _NAME_KEYWORDS = _required_keywords(list(NAME_MAPPINGS))
+    _NAME_KEYWORDS_RE = re.compile('|'.join(_NAME_KEYWORDS))
+    
+    # The node types and layout types each structural detector can accept
+    # (None: any), mirroring the checks the detectors open with, so
+    # _detect_by_structure only tries the detectors that can match a node
+    _STRUCTURE_GATES: Dict[str, Tuple[Optional[FrozenSet[str]], Optional[FrozenSet[str]]]] = {
+        'modus-wc-button': (frozenset({'FRAME', 'RECTANGLE', 'COMPONENT', 'INSTANCE'}), None),
+        'modus-wc-text-input': (frozenset({'FRAME', 'RECTANGLE'}), None),
+        'modus-wc-card': (frozenset({'FRAME', 'COMPONENT', 'INSTANCE'}), None),
+        'modus-wc-navbar': (None, frozenset({'HORIZONTAL'})),
+        'modus-wc-table': (None, frozenset({'GRID', 'VERTICAL'})),
+        'modus-wc-chip': (frozenset({'FRAME', 'COMPONENT', 'INSTANCE'}), None),
+        'modus-wc-avatar': (frozenset({'ELLIPSE', 'FRAME', 'RECTANGLE'}), None),
+    }
+    
     def __init__(self):
-        # Component name mappings (order matters - more specific patterns first)
-        self.NAME_MAPPINGS = {
-            # Buttons
-            r'\b(button|btn|cta)\b': 'modus-wc-button',
-            
-            # Form inputs
-            r'\b(input|text\s?field|textfield)\b': 'modus-wc-text-input',
-            r'\b(text\s?area|textarea)\b': 'modus-wc-textarea',
-            r'\b(number|numeric)\s?(input|field)?\b': 'modus-wc-number-input',
-            r'\b(select|dropdown)\b': 'modus-wc-select',
-            r'\b(checkbox|check)\b': 'modus-wc-checkbox',
-            r'\b(radio|radio\s?button)\b': 'modus-wc-radio',
-            r'\b(switch|toggle)\b': 'modus-wc-switch',
-            r'\b(slider|range)\b': 'modus-wc-slider',
-            r'\b(date|calendar|date\s?picker)\b': 'modus-wc-date',
-            r'\b(time|time\s?picker)\b': 'modus-wc-time-input',
-            r'\b(search|autocomplete|typeahead)\b': 'modus-wc-autocomplete',
-            
-            # Navigation (check sidebar patterns first - they're more specific)
-            r'\b(side\s*navigation|side-navigation|sidebar|side\s*nav|sidenav|aside)\b': 'modus-wc-side-navigation',
-            r'\b(navbar|nav\s*bar|header|top\s*bar|navigation\s*bar)\b': 'modus-wc-navbar',
-            r'\b(breadcrumb|breadcrumbs)\b': 'modus-wc-breadcrumbs',
-            r'\b(tab|tabs)\b': 'modus-wc-tabs',
-            r'\b(pagination|pager)\b': 'modus-wc-pagination',
-            
-            # Display components
-            r'\b(card|tile|panel)\b': 'modus-wc-card',
-            r'\b(table|grid)\b': 'modus-wc-table',
-            r'\b(alert|notification|message)\b': 'modus-wc-alert',
-            r'\b(modal|dialog|popup)\b': 'modus-wc-modal',
-            r'\b(tooltip|hint|popover)\b': 'modus-wc-tooltip',
-            r'\b(badge)\b': 'modus-wc-badge',
-            r'\b(chip|tag|pill)\b': 'modus-wc-chip',
-            r'\b(progress|progress\s?bar)\b': 'modus-wc-progress',
-            r'\b(loader|spinner|loading)\b': 'modus-wc-loader',
-            r'\b(skeleton)\b': 'modus-wc-skeleton',
-            
-            # Other
-            r'\b(avatar|profile\s?pic)\b': 'modus-wc-avatar',
-            r'\b(icon)\b': 'modus-wc-icon',
-            r'\b(divider|separator)\b': 'modus-wc-divider',
-        }
-        
         # Structural patterns for component detection
         self.STRUCTURAL_PATTERNS = {
             'modus-wc-button': self._is_button_structure,
@@ -103,6 +199,14 @@ class ModusComponentMapper:
         
         # Track undetected nodes for developer feedback
         self.undetected_nodes = []
+        
+        # STRUCTURAL_PATTERNS entries that pass the gates, per (node type, layout type)
+        self._structure_dispatch: Dict[Tuple[Optional[str], Optional[str]], List[Tuple[str, Callable[..., bool]]]] = {}
+        
+        # Component type per lowercased name. Design files repeat names like
+        # "Button" or "Frame 12" across many nodes, so most lookups are hits;
+        # the cache is bounded so a long-lived mapper doesn't grow without limit
+        self._type_for_name = functools.lru_cache(maxsize=4096)(self._detect_type_from_name)
     
     def map_layout_to_components(self, layout_node: LayoutNode) -> List[ModusComponent]:
         """
@@ -115,53 +219,67 @@ class ModusComponentMapper:
             List of mapped Modus components
         """
         components = []
-        self._map_node_recursive(layout_node, components)
+        self._map_node_tree(layout_node, components)
         return components
     
-    def _map_node_recursive(self, node: LayoutNode, components: List[ModusComponent], 
-                          parent_component: Optional[ModusComponent] = None) -> None:
-        """Recursively map layout nodes to Modus components"""
-        # Validate node
-        if not node:
-            print(f"Warning: _map_node_recursive received None node")
-            return
-            
-        # Check if node has required attributes
-        if not hasattr(node, 'children'):
-            print(f"Warning: node missing children attribute - type: {type(node)}, id: {getattr(node, 'id', 'unknown')}")
-            return
-        
-        # Try to identify component
-        component = self._identify_component(node)
-        
-        if component:
-            # Add to parent or root list
-            if parent_component:
-                parent_component.children.append(component)
+    def _map_node_tree(self, root: LayoutNode, components: List[ModusComponent],
+                       root_parent: Optional[ModusComponent] = None) -> None:
+        """Map a layout tree to Modus components, visiting nodes depth-first in document order"""
+        # Explicit stack of (children iterator, parent component) instead of
+        # recursion, so deep trees can't hit the recursion limit. Siblings are
+        # consumed from the iterator in place and only nodes with children push
+        # a new entry, which keeps the many leaf nodes cheap
+        stack: List[Tuple[Iterator[Any], Optional[ModusComponent]]] = [(iter((root,)), root_parent)]
+        undetected_nodes = self.undetected_nodes
+        
+        while stack:
+            siblings, parent_component = stack[-1]
+            for node in siblings:
+                # Validate node
+                if not node:
+                    print(f"Warning: _map_node_tree received None node")
+                    continue
+                    
+                # Check if node has required attributes
+                if not hasattr(node, 'children'):
+                    print(f"Warning: node missing children attribute - type: {type(node)}, id: {getattr(node, 'id', 'unknown')}")
+                    continue
+                
+                # Try to identify component
+                component = self._identify_component(node)
+                
+                if component:
+                    # Add to parent or root list
+                    if parent_component:
+                        parent_component.children.append(component)
+                    else:
+                        components.append(component)
+                    
+                    # Process children with this component as parent
+                    child_parent = component
+                else:
+                    # No component identified, process children with same parent
+                    self.stats['undetected'] += 1
+                    
+                    # Track undetected node info for developer feedback (limit to prevent memory issues)
+                    if len(undetected_nodes) < 1000:  # Limit to first 1000 undetected nodes
+                        undetected_nodes.append({
+                            'id': node.id,
+                            'name': node.name,
+                            'type': node.type,
+                            'layout_type': node.layout_type,
+                            'children_count': len(node.children),
+                            'has_text': hasattr(node, 'text') and bool(node.text),
+                            'possible_reasons': self._analyze_unmatch_reasons(node)
+                        })
+                    child_parent = parent_component
+                
+                if node.children:
+                    # Descend now; this level resumes from its iterator afterwards
+                    stack.append((iter(node.children), child_parent))
+                    break
             else:
-                components.append(component)
-            
-            # Process children with this component as parent
-            for child in node.children:
-                self._map_node_recursive(child, components, component)
-        else:
-            # No component identified, process children with same parent
-            self.stats['undetected'] += 1
-            
-            # Track undetected node info for developer feedback (limit to prevent memory issues)
-            if len(self.undetected_nodes) < 1000:  # Limit to first 1000 undetected nodes
-                self.undetected_nodes.append({
-                    'id': node.id,
-                    'name': node.name,
-                    'type': node.type,
-                    'layout_type': node.layout_type,
-                    'children_count': len(node.children),
-                    'has_text': hasattr(node, 'text') and bool(node.text),
-                    'possible_reasons': self._analyze_unmatch_reasons(node)
-                })
-            
-            for child in node.children:
-                self._map_node_recursive(child, components, parent_component)
+                stack.pop()
     
     def _identify_component(self, node: LayoutNode) -> Optional[ModusComponent]:
         """Identify if a node represents a Modus component"""
@@ -173,6 +291,11 @@ class ModusComponentMapper:
         # Increment stats
         self.stats['total_components'] += 1
         
+        # Size is read once here and shared by every detector below
+        bounds = node.original_node.get('absoluteBoundingBox') or {}
+        width = bounds.get('width', 0)
+        height = bounds.get('height', 0)
+        
         # 1. Try naming convention first (highest confidence)
         component_type = self._detect_by_name(node.name)
         if component_type:
@@ -183,11 +306,11 @@ class ModusComponentMapper:
                 original_node_name=node.name,
                 confidence=0.95,
                 detection_method='naming',
-                properties=self._extract_properties(node, component_type)
+                properties=self._extract_properties(node, component_type, height)
             )
         
         # 2. Try structural analysis
-        component_type = self._detect_by_structure(node)
+        component_type = self._detect_by_structure(node, width, height)
         if component_type:
             self.stats['detected_by_structure'] += 1
             return ModusComponent(
@@ -196,11 +319,11 @@ class ModusComponentMapper:
                 original_node_name=node.name,
                 confidence=0.8,
                 detection_method='structure',
-                properties=self._extract_properties(node, component_type)
+                properties=self._extract_properties(node, component_type, height)
             )
         
         # 3. Try style analysis (for simple components)
-        component_type = self._detect_by_style(node)
+        component_type = self._detect_by_style(node, width, height)
         if component_type:
             self.stats['detected_by_style'] += 1
             return ModusComponent(
@@ -209,7 +332,7 @@ class ModusComponentMapper:
                 original_node_name=node.name,
                 confidence=0.7,
                 detection_method='style',
-                properties=self._extract_properties(node, component_type)
+                properties=self._extract_properties(node, component_type, height)
             )
         
         return None
@@ -218,25 +341,44 @@ class ModusComponentMapper:
         """Detect component type by name matching"""
         if not name:
             return None
-            
-        name_lower = name.lower()
         
+        return self._type_for_name(name.lower())
+    
+    def _detect_type_from_name(self, name_lower: str) -> Optional[str]:
+        """Uncached name matching behind _detect_by_name"""
         # Check for exact Modus component names
-        if 'modus-' in name_lower:
+        start = name_lower.find('modus-wc-')
+        if start >= 0:
             # Extract modus component name
-            match = re.search(r'modus-wc-[\w-]+', name_lower)
+            match = _MODUS_TAG_RE.search(name_lower, start)
             if match:
                 return match.group(0)
         
         # Check against name patterns
-        for pattern, component_type in self.NAME_MAPPINGS.items():
-            if re.search(pattern, name_lower, re.IGNORECASE):
-                return component_type
+        return self._match_name_mappings(name_lower)
+    
+    def _match_name_mappings(self, name_lower: str) -> Optional[str]:
+        """Return the component type of the first NAME_MAPPINGS pattern found in the name"""
+        # Plain keyword scan first; IGNORECASE can fold some non-ASCII letters
+        # onto ASCII ones, so only ASCII names are rejected this way
+        if name_lower.isascii() and not self._NAME_KEYWORDS_RE.search(name_lower):
+            return None
         
-        return None
+        # One pass over the name rules out most names, which match no pattern
+        match = self._NAME_MAPPINGS_RE.search(name_lower)
+        if not match:
+            return None
+        
+        # The alternation reports the leftmost match, not the highest-priority
+        # pattern, so only the patterns ahead of it still need checking
+        found = self._NAME_MAPPING_INDEX[match.lastgroup]
+        for pattern, component_type in self._COMPILED_NAME_MAPPINGS[:found]:
+            if pattern.search(name_lower):
+                return component_type
+        return self._COMPILED_NAME_MAPPINGS[found][1]
     
-    def _detect_by_structure(self, node: LayoutNode) -> Optional[str]:
-        """Detect component type by structural analysis"""
+    def _detect_by_structure(self, node: LayoutNode, width: float, height: float) -> Optional[str]:
+        """Detect component type by structural analysis, given the node's bounding box size"""
         
         # NEW: Check for INSTANCE nodes with componentId
         if node.type == 'INSTANCE' and node.original_node:
@@ -246,38 +388,45 @@ class ModusComponentMapper:
                 name = node.name.lower() if node.name else ''
                 
                 # Check against our name mappings
-                for pattern, component_type in self.NAME_MAPPINGS.items():
-                    if re.search(pattern, name, re.IGNORECASE):
-                        return component_type
+                component_type = self._match_name_mappings(name)
+                if component_type:
+                    return component_type
                 
-                # Check variant properties for clues
-                variant_props = node.original_node.get('variantProperties', {})
-                if variant_props:
-                    # Check for common variant property names
-                    if 'type' in variant_props:
-                        variant_type = variant_props['type'].lower()
-                        if 'button' in variant_type:
-                            return 'modus-wc-button'
-                        elif 'input' in variant_type:
-                            return 'modus-wc-text-input'
-                        elif 'nav' in variant_type:
-                            return 'modus-wc-navbar'
-        
-        # Continue with existing structural patterns
-        for component_type, detector_func in self.STRUCTURAL_PATTERNS.items():
-            if detector_func(node):
+                # Check the "type" variant property for clues
+                variant_props = node.original_node.get('variantProperties')
+                if variant_props and 'type' in variant_props:
+                    variant_type = variant_props['type'].lower()
+                    for keyword, variant_component_type in _VARIANT_TYPE_KEYWORDS:
+                        if keyword in variant_type:
+                            return variant_component_type
+        
+        # Continue with existing structural patterns, skipping those whose
+        # detector rejects this kind of node outright
+        key = (node.type, node.layout_type)
+        detectors = self._structure_dispatch.get(key)
+        if detectors is None:
+            detectors = self._structure_dispatch[key] = self._structure_detectors_for(*key)
+        for component_type, detector_func in detectors:
+            if detector_func(node, width, height):
                 return component_type
         return None
     
-    def _detect_by_style(self, node: LayoutNode) -> Optional[str]:
-        """Detect component type by style analysis"""
-        original = node.original_node
-        
+    def _structure_detectors_for(self, node_type: Optional[str],
+                                 layout_type: Optional[str]) -> List[Tuple[str, Callable[..., bool]]]:
+        """STRUCTURAL_PATTERNS entries, in order, that can match a node of this type and layout"""
+        detectors = []
+        for component_type, detector_func in self.STRUCTURAL_PATTERNS.items():
+            node_types, layout_types = self._STRUCTURE_GATES.get(component_type, (None, None))
+            if node_types is not None and node_type not in node_types:
+                continue
+            if layout_types is not None and layout_type not in layout_types:
+                continue
+            detectors.append((component_type, detector_func))
+        return detectors
+    
+    def _detect_by_style(self, node: LayoutNode, width: float, height: float) -> Optional[str]:
+        """Detect component type by style analysis, given the node's bounding box size"""
         # Check for icon-like elements (small square/rectangular shapes)
-        bounds = original.get('absoluteBoundingBox', {})
-        width = bounds.get('width', 0)
-        height = bounds.get('height', 0)
-        
         if (node.type in ['RECTANGLE', 'FRAME'] and 
             width == height and
             10 <= width <= 50):
@@ -291,7 +440,7 @@ class ModusComponentMapper:
         return None
     
     # Structural detection functions
-    def _is_button_structure(self, node: LayoutNode) -> bool:
+    def _is_button_structure(self, node: LayoutNode, width: float, height: float) -> bool:
         """Check if node has button-like structure"""
         # Button typically has:
         # - Frame/Rectangle with text child
@@ -302,9 +451,6 @@ class ModusComponentMapper:
             return False
         
         # Check size constraints
-        bounds = node.original_node.get('absoluteBoundingBox', {})
-        width = bounds.get('width', 0)
-        height = bounds.get('height', 0)
         if width < 50 or height < 24:
             return False
         
@@ -322,14 +468,11 @@ class ModusComponentMapper:
         
         return has_text_child and (has_fills or has_corner_radius or has_effects)
     
-    def _is_input_structure(self, node: LayoutNode) -> bool:
+    def _is_input_structure(self, node: LayoutNode, width: float, height: float) -> bool:
         """Check if node has input-like structure"""
         if node.type not in ['FRAME', 'RECTANGLE']:
             return False
         
-        bounds = node.original_node.get('absoluteBoundingBox', {})
-        width = bounds.get('width', 0)
-        height = bounds.get('height', 0)
         if width < 100 or height < 30:
             return False
         
@@ -342,15 +485,12 @@ class ModusComponentMapper:
         
         return has_strokes or (width > height * 3 and has_text)
     
-    def _is_card_structure(self, node: LayoutNode) -> bool:
+    def _is_card_structure(self, node: LayoutNode, width: float, height: float) -> bool:
         """Check if node has card-like structure"""
         if node.type not in ['FRAME', 'COMPONENT', 'INSTANCE']:
             return False
         
         # Cards are usually larger containers
-        bounds = node.original_node.get('absoluteBoundingBox', {})
-        width = bounds.get('width', 0)
-        height = bounds.get('height', 0)
         if width < 150 or height < 100:
             return False
         
@@ -368,7 +508,7 @@ class ModusComponentMapper:
         
         return (has_background or has_shadow) and has_multiple_children
     
-    def _is_navbar_structure(self, node: LayoutNode) -> bool:
+    def _is_navbar_structure(self, node: LayoutNode, width: float, height: float) -> bool:
         """Check if node has navbar-like structure"""
         if node.layout_type != 'HORIZONTAL':
             return False
@@ -379,15 +519,13 @@ class ModusComponentMapper:
             return False
         
         # Wide and thin
-        width = bounds.get('width', 0)
-        height = bounds.get('height', 0)
         if height > width * 0.2:
             return False
         
         # Has multiple children (nav items)
         return len(node.children) >= 2
     
-    def _is_table_structure(self, node: LayoutNode) -> bool:
+    def _is_table_structure(self, node: LayoutNode, width: float, height: float) -> bool:
         """Check if node has table-like structure"""
         # Tables can be detected as GRID layout
         if node.layout_type == 'GRID':
@@ -407,14 +545,11 @@ class ModusComponentMapper:
         
         return False
     
-    def _is_chip_structure(self, node: LayoutNode) -> bool:
+    def _is_chip_structure(self, node: LayoutNode, width: float, height: float) -> bool:
         """Check if node has chip-like structure"""
         if node.type not in ['FRAME', 'COMPONENT', 'INSTANCE']:
             return False
         
-        bounds = node.original_node.get('absoluteBoundingBox', {})
-        width = bounds.get('width', 0)
-        height = bounds.get('height', 0)
         # Chips are small, pill-shaped elements
         if width < 40 or height < 20 or height > 40:
             return False
@@ -428,14 +563,11 @@ class ModusComponentMapper:
         
         return has_corner_radius and has_text
     
-    def _is_avatar_structure(self, node: LayoutNode) -> bool:
+    def _is_avatar_structure(self, node: LayoutNode, width: float, height: float) -> bool:
         """Check if node has avatar-like structure"""
         if node.type not in ['ELLIPSE', 'FRAME', 'RECTANGLE']:
             return False
         
-        bounds = node.original_node.get('absoluteBoundingBox', {})
-        width = bounds.get('width', 0)
-        height = bounds.get('height', 0)
         # Avatars are typically square or circular
         if abs(width - height) > 5:
             return False
@@ -457,8 +589,8 @@ class ModusComponentMapper:
         
         return True  # ELLIPSE type is likely an avatar
     
-    def _extract_properties(self, node: LayoutNode, component_type: str) -> Dict[str, Any]:
-        """Extract component-specific properties"""
+    def _extract_properties(self, node: LayoutNode, component_type: str, height: float) -> Dict[str, Any]:
+        """Extract component-specific properties, given the node's bounding box height"""
         props = {}
         original = node.original_node
         
@@ -501,18 +633,12 @@ class ModusComponentMapper:
                 # Ensure fills is a list and contains dicts
                 if isinstance(fills, list) and fills and isinstance(fills[0], dict) and fills[0].get('type') == 'SOLID':
                     color = fills[0].get('color', {})
-                    # Simple heuristic for button types
-                    if self._is_primary_color(color):
-                        props['variant'] = 'primary'
-                    elif self._is_secondary_color(color):
-                        props['variant'] = 'secondary'
-                    else:
-                        props['variant'] = 'tertiary'
+                    # Simple heuristic for button types; buttons have no error variant
+                    color_role = self._classify_color(color)
+                    props['variant'] = color_role if color_role in ('primary', 'secondary') else 'tertiary'
             
             # Extract size if not from variants
             if 'size' not in props:
-                bounds = original.get('absoluteBoundingBox', {})
-                height = bounds.get('height', 0)
                 if height <= 32:
                     props['size'] = 'small'
                 elif height >= 48:
@@ -530,7 +656,7 @@ class ModusComponentMapper:
             # Check for error state (red border)
             strokes = original.get('strokes', [])
             # Ensure strokes is a list/array before accessing elements
-            if isinstance(strokes, list) and strokes and isinstance(strokes[0], dict) and self._is_error_color(strokes[0].get('color', {})):
+            if isinstance(strokes, list) and strokes and isinstance(strokes[0], dict) and self._classify_color(strokes[0].get('color', {})) == 'error':
                 props['invalid'] = True
             
             # NEW: Check for placeholder text
@@ -545,8 +671,6 @@ class ModusComponentMapper:
         elif component_type == 'modus-wc-chip':
             # Extract chip properties
             if 'size' not in props:
-                bounds = original.get('absoluteBoundingBox', {})
-                height = bounds.get('height', 0)
                 props['size'] = 'small' if height <= 24 else 'medium'
             
         elif component_type == 'modus-wc-navbar':
@@ -629,20 +753,21 @@ class ModusComponentMapper:
         
         return css
     
-    def _is_primary_color(self, color: Dict[str, float]) -> bool:
-        """Check if color is likely a primary color (blue-ish)"""
-        r, g, b = color.get('r', 0), color.get('g', 0), color.get('b', 0)
-        return b > 0.5 and b > r and b > g
-    
-    def _is_secondary_color(self, color: Dict[str, float]) -> bool:
-        """Check if color is likely a secondary color (gray-ish)"""
-        r, g, b = color.get('r', 0), color.get('g', 0), color.get('b', 0)
-        return abs(r - g) < 0.1 and abs(g - b) < 0.1 and 0.3 < r < 0.8
-    
-    def _is_error_color(self, color: Dict[str, float]) -> bool:
-        """Check if color is likely an error color (red-ish)"""
+    def _classify_color(self, color: Dict[str, float]) -> str:
+        """
+        Classify a Figma color as 'error' (red-ish), 'primary' (blue-ish),
+        'secondary' (gray-ish) or 'tertiary' (anything else). A red-ish color
+        is never blue- or gray-ish, but a light bluish gray (e.g. r=g=.6,
+        b=.65) is both, so primary must stay ahead of secondary.
+        """
         r, g, b = color.get('r', 0), color.get('g', 0), color.get('b', 0)
-        return r > 0.5 and r > g * 1.5 and r > b * 1.5
+        if r > 0.5 and r > g * 1.5 and r > b * 1.5:
+            return 'error'
+        if b > 0.5 and b > r and b > g:
+            return 'primary'
+        if abs(r - g) < 0.1 and abs(g - b) < 0.1 and 0.3 < r < 0.8:
+            return 'secondary'
+        return 'tertiary'
     
     def _analyze_unmatch_reasons(self, node: LayoutNode) -> List[str]:
         """Analyze why a node couldn't be matched to a Modus component"""